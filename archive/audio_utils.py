@@ -36,6 +36,40 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+def _mulaw_decode_sample(mulaw_byte: int) -> int:
+    """Decode one G.711 μ-law byte to a 16-bit linear sample (same values as audioop.ulaw2lin)"""
+    mulaw_byte = ~mulaw_byte & 0xFF
+    sign = mulaw_byte & 0x80
+    exponent = (mulaw_byte >> 4) & 0x07
+    mantissa = mulaw_byte & 0x0F
+    sample = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return -sample if sign else sample
+
+_MULAW_SEGMENT_ENDS = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+
+def _mulaw_encode_sample(sample: int) -> int:
+    """Encode one 16-bit linear sample as a G.711 μ-law byte (same values as audioop.lin2ulaw)"""
+    pcm_val = sample >> 2
+    if pcm_val < 0:
+        pcm_val = -pcm_val
+        mask = 0x7F
+    else:
+        mask = 0xFF
+    pcm_val = min(pcm_val, 8159) + (0x84 >> 2)
+    for segment, segment_end in enumerate(_MULAW_SEGMENT_ENDS):
+        if pcm_val <= segment_end:
+            return ((segment << 4) | ((pcm_val >> (segment + 1)) & 0x0F)) ^ mask
+    return 0x7F ^ mask
+
+# μ-law ↔ PCM16 are fixed mappings; index them instead of converting per sample
+if NUMPY_AVAILABLE:
+    MULAW_TO_PCM16 = np.array([_mulaw_decode_sample(i) for i in range(256)], dtype='<i2')
+    # Indexed by the sample's bit pattern read as uint16 (negative samples live in the top half)
+    PCM16_TO_MULAW = np.array(
+        [_mulaw_encode_sample(i - 0x10000 if i & 0x8000 else i) for i in range(0x10000)],
+        dtype=np.uint8
+    )
+
 class AudioConverter:
     """Audio format conversion utilities for Twilio integration"""
     
@@ -46,13 +80,17 @@ class AudioConverter:
     @staticmethod
     def mulaw_to_pcm(mulaw_data: bytes) -> bytes:
         """Convert μ-law audio to linear PCM"""
+        if NUMPY_AVAILABLE:
+            # One table gather per sample (the table is 512 bytes, stays in L1)
+            return MULAW_TO_PCM16[np.frombuffer(mulaw_data, dtype=np.uint8)].tobytes()
+        
         if not AUDIOOP_AVAILABLE:
             raise RuntimeError("audioop not available for μ-law conversion")
         
         try:
             # Convert μ-law to 16-bit PCM
             pcm_data = audioop.ulaw2lin(mulaw_data, 2)
-            logger.debug(f"Converted {len(mulaw_data)} μ-law bytes to {len(pcm_data)} PCM bytes")
+            logger.debug("Converted %d μ-law bytes to %d PCM bytes", len(mulaw_data), len(pcm_data))
             return pcm_data
         except Exception as e:
             logger.error(f"μ-law to PCM conversion failed: {e}")
@@ -61,13 +99,17 @@ class AudioConverter:
     @staticmethod
     def pcm_to_mulaw(pcm_data: bytes) -> bytes:
         """Convert linear PCM to μ-law audio"""
+        if NUMPY_AVAILABLE:
+            # One table gather per sample (the table is 64KB, stays in L2)
+            return PCM16_TO_MULAW[np.frombuffer(pcm_data, dtype='<u2')].tobytes()
+        
         if not AUDIOOP_AVAILABLE:
             raise RuntimeError("audioop not available for μ-law conversion")
         
         try:
             # Convert 16-bit PCM to μ-law
             mulaw_data = audioop.lin2ulaw(pcm_data, 2)
-            logger.debug(f"Converted {len(pcm_data)} PCM bytes to {len(mulaw_data)} μ-law bytes")
+            logger.debug("Converted %d PCM bytes to %d μ-law bytes", len(pcm_data), len(mulaw_data))
             return mulaw_data
         except Exception as e:
             logger.error(f"PCM to μ-law conversion failed: {e}")
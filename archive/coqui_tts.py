@@ -12,6 +12,7 @@ import base64
 import logging
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, AsyncGenerator
 
@@ -30,6 +31,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# XTTS model load and synthesis for concurrent callers; torch threads are split across these workers below
+INFERENCE_WORKERS = min(4, os.cpu_count() or 1)
+inference_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="coqui")
+
 class CoquiTTSHandler:
     def __init__(self, model_name: str = "tts_models/multilingual/multi-dataset/xtts_v2"):
         self.model_name = model_name
@@ -52,10 +57,14 @@ class CoquiTTSHandler:
             raise RuntimeError("Coqui TTS not available - install with: pip install TTS")
             
         try:
+            # Split the cores between workers so parallel syntheses don't oversubscribe BLAS
+            if self.device == "cpu":
+                torch.set_num_threads(max(1, (os.cpu_count() or 1) // INFERENCE_WORKERS))
+            
             # Run initialization in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             self.tts = await loop.run_in_executor(
-                None, 
+                inference_executor, 
                 lambda: TTS(self.model_name).to(self.device)
             )
             
@@ -88,7 +97,7 @@ class CoquiTTSHandler:
             if self.speaker_wav_path:
                 # Voice cloning mode
                 wav_data = await loop.run_in_executor(
-                    None,
+                    inference_executor,
                     lambda: self.tts.tts(
                         text=text,
                         speaker_wav=self.speaker_wav_path,
@@ -99,7 +108,7 @@ class CoquiTTSHandler:
                 # Default voice mode - use built-in speaker
                 # XTTS-v2 has several built-in speakers, using a pleasant default
                 wav_data = await loop.run_in_executor(
-                    None,
+                    inference_executor,
                     lambda: self.tts.tts(
                         text=text,
                         language=language,
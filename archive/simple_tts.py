@@ -11,6 +11,7 @@ import asyncio
 import logging
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, AsyncGenerator
 
@@ -38,6 +39,9 @@ class SimpleTTSHandler:
     
     def __init__(self):
         self.engine = None
+        # pyttsx3 engines must stay on the thread that created them, so init and
+        # synthesis all run on this one worker instead of blocking the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simple-tts")
         logger.info("🗣️ Initializing Simple TTS handler")
         
     async def initialize(self, speaker_wav_path: Optional[str] = None):
@@ -49,7 +53,7 @@ class SimpleTTSHandler:
         try:
             # Initialize engine in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            self.engine = await loop.run_in_executor(None, pyttsx3.init)
+            self.engine = await loop.run_in_executor(self.executor, pyttsx3.init)
             
             # Set voice properties
             voices = self.engine.getProperty('voices')
@@ -92,8 +96,9 @@ class SimpleTTSHandler:
             with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
                 temp_path = temp_file.name
             
-            # Run TTS synchronously (pyttsx3 doesn't work well in thread pools)
-            self._synthesize_to_file(text, temp_path)
+            # Run TTS on the engine's own thread so concurrent calls keep streaming
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self.executor, self._synthesize_to_file, text, temp_path)
             
             # Read the generated audio file
             if os.path.exists(temp_path):
@@ -10,8 +10,6 @@ import asyncio
 import base64
 import logging
 import os
-import subprocess
-import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -52,50 +50,40 @@ class StaticKillerConverter:
             Raw μ-law bytes ready for Twilio, or None if conversion failed
         """
         try:
-            # Create temporary files for FFmpeg processing
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as input_file:
-                input_file.write(wav_data)
-                input_path = input_file.name
-            
-            with tempfile.NamedTemporaryFile(suffix='.ulaw', delete=False) as output_file:
-                output_path = output_file.name
-            
-            # The proven FFmpeg command from Static Hell guide
+            # The proven FFmpeg command from Static Hell guide, piped through
+            # stdin/stdout so nothing touches the disk
             ffmpeg_cmd = [
                 'ffmpeg',
                 '-hide_banner',
                 '-loglevel', 'error',
-                '-i', input_path,
+                '-i', 'pipe:0',
                 '-ar', '8000',      # 8kHz sample rate
                 '-ac', '1',         # Mono
                 '-f', 'mulaw',      # Raw μ-law format (no headers!)
-                '-y',               # Overwrite output
-                output_path
+                'pipe:1'
             ]
             
-            # Run FFmpeg conversion
+            # Run FFmpeg conversion (communicate() feeds stdin while draining
+            # stdout/stderr, so a full pipe can't deadlock either side)
             result = await asyncio.create_subprocess_exec(
                 *ffmpeg_cmd,
+                stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
-            stdout, stderr = await result.communicate()
+            raw_mulaw_data, stderr = await result.communicate(wav_data)
             
             if result.returncode != 0:
                 error_msg = stderr.decode() if stderr else "Unknown FFmpeg error"
                 logger.error(f"❌ FFmpeg conversion failed: {error_msg}")
                 return None
             
-            # Read the generated raw μ-law data
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                with open(output_path, 'rb') as f:
-                    raw_mulaw_data = f.read()
-                
-                logger.info(f"✅ Static Killer: Converted {len(wav_data)} WAV bytes → {len(raw_mulaw_data)} raw μ-law bytes")
-                return raw_mulaw_data
-            else:
-                logger.error("❌ FFmpeg output file is empty or missing")
+            if not raw_mulaw_data:
+                logger.error("❌ FFmpeg produced no output")
                 return None
+            
+            logger.info(f"✅ Static Killer: Converted {len(wav_data)} WAV bytes → {len(raw_mulaw_data)} raw μ-law bytes")
+            return raw_mulaw_data
                 
         except FileNotFoundError:
             logger.error("❌ FFmpeg not found - install with: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)")
@@ -103,14 +91,6 @@ class StaticKillerConverter:
         except Exception as e:
             logger.error(f"❌ Static Killer conversion failed: {e}")
             return None
-        finally:
-            # Clean up temporary files
-            for path in [input_path, output_path]:
-                try:
-                    if 'path' in locals() and os.path.exists(path):
-                        os.unlink(path)
-                except:
-                    pass
     
     def chunk_raw_mulaw(self, raw_mulaw_data: bytes) -> list[bytes]:
         """
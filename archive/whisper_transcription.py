@@ -6,8 +6,10 @@ Handles streaming audio transcription for the Coqui TTS system
 import asyncio
 import logging
 import io
+import os
 import wave
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, AsyncGenerator
 from collections import deque
 
@@ -28,6 +30,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# faster-whisper decodes (and the lazy segment generator) run here, off the event loop
+INFERENCE_WORKERS = min(4, os.cpu_count() or 1)
+inference_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix="whisper")
+
 class AudioBuffer:
     """Buffer for collecting audio chunks before transcription"""
     
@@ -105,7 +111,7 @@ class WhisperTranscriber:
             # Initialize model in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             self.model = await loop.run_in_executor(
-                None,
+                inference_executor,
                 lambda: WhisperModel(
                     self.model_size,
                     device=self.device,
@@ -142,14 +148,16 @@ class WhisperTranscriber:
             
             # Run transcription in thread pool
             loop = asyncio.get_event_loop()
-            segments, info = await loop.run_in_executor(
-                None,
-                lambda: self.model.transcribe(
+            # segments is a lazy generator - decoding happens while iterating it,
+            # so consume it in the worker too rather than on the event loop
+            segments = await loop.run_in_executor(
+                inference_executor,
+                lambda: list(self.model.transcribe(
                     io.BytesIO(wav_data),
                     language="en",  # Can be made configurable
                     vad_filter=True,  # Voice activity detection
                     vad_parameters=dict(min_silence_duration_ms=500)
-                )
+                )[0])
             )
             
             # Combine all segments
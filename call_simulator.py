@@ -43,8 +43,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI API
-openai.api_key = os.environ.get('OPENAI_API_KEY')
+# Initialize OpenAI API (async client, same as the production app)
+openai_client = openai.AsyncOpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
 
 
 class CallSimulator:
@@ -119,14 +119,14 @@ class CallSimulator:
         # Get AI response using actual GPT API
         logger.info(f"🤔 Thinking... (generating response)")
         try:
-            response = await openai.ChatCompletion.acreate(
+            response = await openai_client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=self.conversation_history,
                 max_tokens=100,
                 temperature=0.9
             )
 
-            ai_message = response['choices'][0]['message']['content']
+            ai_message = response.choices[0].message.content
 
             # Add to history
             self.conversation_history.append({"role": "assistant", "content": ai_message})
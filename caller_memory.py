@@ -194,22 +194,25 @@ def get_response_style_prompt() -> str:
     return random.choices(prompts, weights=weights)[0]
 
 
+# Fixed set, so main.py can pre-generate their audio at startup
+FILLER_WORDS = (
+    "Hmm.",
+    "Oh!",
+    "Yeah.",
+    "Right.",
+    "Okay.",
+    "Interesting.",
+    "Totally.",
+    "For sure.",
+    "I hear you.",
+    "Mmhmm.",
+)
+
+
 def get_filler_word() -> str:
     """
     Get a quick filler word to play immediately when silence is detected.
 
     This makes the response feel instant (1s filler + 3-4s for real response = feels faster!)
     """
-    filler_words = [
-        "Hmm.",
-        "Oh!",
-        "Yeah.",
-        "Right.",
-        "Okay.",
-        "Interesting.",
-        "Totally.",
-        "For sure.",
-        "I hear you.",
-        "Mmhmm.",
-    ]
-    return random.choice(filler_words)
+    return random.choice(FILLER_WORDS)
@@ -1,25 +1,60 @@
 # Standard library imports
 import asyncio
 import base64
+import binascii
+import contextlib
+import functools
 import hashlib
+import html
 import json
 import logging
 import os
 import random
+import re
+import shutil
+import tempfile
 import time
-from collections import deque
+import uuid
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 # Third-party imports
 import httpx
 import openai
+import orjson
 import websockets
 from dotenv import load_dotenv
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse, Response
+from fastapi import Depends, FastAPI, Form, Request, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Connect, Stream
+from twilio.twiml.voice_response import VoiceResponse
+
+# Local imports
+import transcript_store
+
+# Hot-path aliases for the per-frame Twilio media loops (~50 frames/sec per call)
+_loads = orjson.loads
+# binascii directly: base64.b64decode only adds a str→bytes copy and argument checks on top
+_b64decode = binascii.a2b_base64
+
+def _b64frame(chunk) -> str:
+    """Base64 one µ-law frame (bytes or a memoryview slice) for a Twilio media payload"""
+    return binascii.b2a_base64(chunk, newline=False).decode('ascii')
+
+def _dumps(obj) -> str:
+    """orjson-encode for websocket.send_text (Twilio expects text frames)"""
+    return orjson.dumps(obj).decode()
+
+# Optional: Redis for a TTS audio cache shared across processes/restarts
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
@@ -32,7 +67,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # FastAPI app
-app = FastAPI(title="Artist Hotline Voice Agent", version="1.0.0")
+# orjson for every JSON endpoint (health, config checks, transcripts)
+app = FastAPI(title="Artist Hotline Voice Agent", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Configuration from environment
 class Config:
@@ -58,20 +94,284 @@ class Config:
     # Feature Flags
     USE_STREAMING: bool = os.getenv("USE_STREAMING", "false").lower() == "true"
     USE_COQUI_TEST: bool = os.getenv("USE_COQUI_TEST", "false").lower() == "true"
+    USE_EARLY_PLAY: bool = os.getenv("USE_EARLY_PLAY", "false").lower() == "true"
+
+    # ElevenLabs rejects requests beyond the plan's concurrency limit
+    ELEVEN_LABS_MAX_CONCURRENCY: int = int(os.getenv("ELEVEN_LABS_MAX_CONCURRENCY", "2"))
+    # OpenAI requests in flight at once (keep under the account's rate limit)
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "20"))
+
+    # Optional shared TTS cache
+    REDIS_URL: str = os.getenv("REDIS_URL", "")
+    TTS_CACHE_TTL: int = int(os.getenv("TTS_CACHE_TTL", "86400"))
+
+    # In-process generated-audio cache budget
+    AUDIO_CACHE_MAX_BYTES: int = int(os.getenv("AUDIO_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    # Disk tier for audio evicted from memory (0 disables it)
+    AUDIO_SPILL_DIR: str = os.getenv("AUDIO_SPILL_DIR", os.path.join(tempfile.gettempdir(), "artist-hotline-audio"))
+    AUDIO_SPILL_MAX_BYTES: int = int(os.getenv("AUDIO_SPILL_MAX_BYTES", str(512 * 1024 * 1024)))
+
+    # Format of the TTS audio behind <Play>: "mp3", or "ulaw" for 8kHz µ-law, which
+    # is what the phone leg carries anyway (half the bytes, nothing for Twilio to transcode)
+    TTS_AUDIO_FORMAT: str = os.getenv("TTS_AUDIO_FORMAT", "mp3").lower()
 
 config = Config()
 
-# Configure OpenAI
-openai.api_key = config.OPENAI_API_KEY
+# TTS_AUDIO_FORMAT -> (ElevenLabs output_format, Content-Type served to Twilio, spill file suffix)
+TTS_AUDIO_FORMATS = {
+    # 22kHz/32kbps is plenty for a phone line
+    "mp3": ("mp3_22050_32", "audio/mpeg", ".mp3"),
+    # Raw headerless µ-law; audio/ulaw is the type Twilio's <Play> takes for it
+    "ulaw": ("ulaw_8000", "audio/ulaw", ".ulaw"),
+}
+TTS_OUTPUT_FORMAT, TTS_MEDIA_TYPE, TTS_FILE_SUFFIX = TTS_AUDIO_FORMATS.get(
+    config.TTS_AUDIO_FORMAT, TTS_AUDIO_FORMATS["mp3"]
+)
+
+# Everything in the request body after the text, encoded once: b'"model_id":...}'
+ELEVENLABS_TTS_BODY_TAIL = orjson.dumps({
+    "model_id": "eleven_flash_v2_5",  # Fastest model
+    "voice_settings": {
+        "stability": 0.3,
+        "similarity_boost": 0.75,
+        "style": 0.0,
+        "use_speaker_boost": True
+    },
+})[1:]
+
+# Everything besides the text that decides what the TwiML audio sounds like. Audio
+# that outlives the process (the disk tier, Redis) is filed under it, so changing the
+# voice, its settings or the format never replays clips made with the old ones.
+TTS_VOICE_TAG = hashlib.blake2b(
+    f"{config.ELEVEN_LABS_VOICE_ID}:{TTS_OUTPUT_FORMAT}:".encode() + ELEVENLABS_TTS_BODY_TAIL, digest_size=6
+).hexdigest()
+
+# Generated audio is served at AUDIO_URL_PREFIX + text hash
+AUDIO_URL_PREFIX = f"{config.BASE_URL.rstrip('/')}/audio/"
+
+# Media Stream base URL (same host as BASE_URL, over wss://)
+WS_URL = config.BASE_URL.replace("https://", "wss://").replace("http://", "ws://")
+MEDIA_STREAM_URL = f"{WS_URL}/media-stream"
+COQUI_STREAM_URL = f"{WS_URL}/coqui-stream"
+STATIC_KILLER_STREAM_URL = f"{WS_URL}/static-killer-stream"
+DEBUG_STREAM_URL = f"{WS_URL}/test-websocket-debug"
+
+# Initialize Twilio client (pooled requests session keeps the TLS connection alive between SMS sends)
+twilio_client = Client(
+    config.TWILIO_ACCOUNT_SID,
+    config.TWILIO_AUTH_TOKEN,
+    http_client=TwilioHttpClient(pool_connections=True)
+)
+
+# Shared async HTTP client for ElevenLabs and OpenAI so each request reuses a warm
+# keep-alive connection instead of paying TCP + TLS setup every time. Idle
+# connections are kept for 5 minutes (httpx drops them after 5s by default),
+# so the gap between a caller's turns doesn't cost a fresh handshake.
+http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=300.0),
+    timeout=10.0
+)
+
+# One async OpenAI client for every call (completions, summaries, transcription): it
+# doesn't block the event loop, and it rides the shared pool above so OpenAI's
+# connection stays warm between turns too. Its own timeout, since the pool's 10s
+# default is tuned for TTS and a transcription upload can take longer.
+# None without OPENAI_API_KEY (the SDK refuses to build a client with no key); the
+# ElevenLabs-only, Coqui and debug routes still run, and the GPT paths use their fallbacks.
+openai_client = None
+if config.OPENAI_API_KEY:
+    openai_client = openai.AsyncOpenAI(api_key=config.OPENAI_API_KEY, http_client=http_client, timeout=30.0)
+else:
+    logger.warning("OPENAI_API_KEY is not set - replies, summaries and transcription will use fallbacks")
+# A burst of calls queues here rather than tripping 429s (the SDK itself retries
+# 429s and 5xx with backoff, which only adds latency if we overshoot)
+_openai_semaphore = asyncio.Semaphore(config.OPENAI_MAX_CONCURRENCY)
+
+# Redis client for the persistent TTS cache (None when not configured)
+redis_client = None
+if config.REDIS_URL:
+    if REDIS_AVAILABLE:
+        redis_client = aioredis.from_url(config.REDIS_URL)
+    else:
+        logger.warning("REDIS_URL is set but redis is not installed - TTS cache is in-memory only")
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    # Also closes openai_client's connections (it shares this pool)
+    await http_client.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
 
-# Initialize Twilio client
-twilio_client = Client(config.TWILIO_ACCOUNT_SID, config.TWILIO_AUTH_TOKEN)
+class BoundedAudioCache:
+    """
+    Generated audio by text hash, bounded to max_bytes of audio in total.
+    Every unique reply gets cached, so a plain dict grew for the life of the
+    process.
+
+    Eviction is two-tier (LRU-2 style): new audio starts on probation and is
+    promoted once it's read a second time. One-off replies only ever leave
+    probation by being evicted, so a run of them can't push out the phrases
+    that keep getting replayed (greetings, fillers).
+    """
+    __slots__ = ('_probation', '_protected', '_pinned', '_bytes', 'max_bytes', 'on_evict')
+
+    def __init__(self, max_bytes: int, on_evict=None):
+        # Values are [audio, reads]; the read count only matters until promotion
+        self._probation: "OrderedDict[str, list]" = OrderedDict()
+        self._protected: "OrderedDict[str, list]" = OrderedDict()
+        # Keys that are never evicted (fixed phrases every call plays)
+        self._pinned: set = set()
+        self._bytes = 0
+        self.max_bytes = max_bytes
+        # Called with (key, audio) for each entry pushed out by the budget
+        self.on_evict = on_evict
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._protected or key in self._probation
+
+    def __len__(self) -> int:
+        return len(self._protected) + len(self._probation)
+
+    def __getitem__(self, key: str) -> bytes:
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return self._protected[key][0]
+        entry = self._probation[key]
+        entry[1] += 1
+        if entry[1] >= 2:
+            self._protected[key] = self._probation.pop(key)
+        else:
+            self._probation.move_to_end(key)
+        return entry[0]
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def peek(self, key: str, default=None):
+        """get() without counting as a use (for internal copies, e.g. to Redis)"""
+        entry = self._protected.get(key) or self._probation.get(key)
+        return default if entry is None else entry[0]
+
+    def pin(self, key: str):
+        """Exempt key from eviction (it may be stored before or after pinning)"""
+        self._pinned.add(key)
+
+    def __setitem__(self, key: str, value: bytes):
+        # Replacing promoted audio keeps it promoted
+        tier = self._protected if key in self._protected else self._probation
+        old = tier.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[0])
+        tier[key] = [value, 0]
+        self._bytes += len(value)
+        self._evict(key)
+
+    def _evict(self, keep: str):
+        # Probation goes first; never evict pinned keys or the entry just stored,
+        # even if it alone is over budget
+        while self._bytes > self.max_bytes:
+            for tier in (self._probation, self._protected):
+                victim = next((k for k in tier if k != keep and k not in self._pinned), None)
+                if victim is not None:
+                    break
+            else:
+                return
+            audio = tier.pop(victim)[0]
+            self._bytes -= len(audio)
+            if self.on_evict is not None:
+                self.on_evict(victim, audio)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+class AudioSpill:
+    """
+    Disk tier under audio_cache. Clips evicted from memory are written here and
+    served with FileResponse, which hands the file to the socket with
+    sendfile(2) - no copy through Python, and a cold clip costs a page-cache
+    read instead of a regeneration. Oldest files are deleted past max_bytes.
+    Files left by an earlier process are picked up at startup.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".mp3"):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._files: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        if max_bytes > 0:
+            os.makedirs(directory, exist_ok=True)
+            self._adopt_existing()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def _adopt_existing(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-len(self.suffix)], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._track(key, size)
+
+    def _track(self, key: str, size: int):
+        self._files[key] = size
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(self._files) > 1:
+            old_key, old_size = self._files.popitem(last=False)
+            self._bytes -= old_size
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._file(old_key))
+
+    def path(self, key: str) -> Optional[str]:
+        """File holding key's audio, if it's been spilled (only known keys map to paths)"""
+        return self._file(key) if key in self._files else None
+
+    def _write(self, key: str, audio: bytes):
+        # Write then rename, so a reader never sees a partial file
+        tmp_path = self._file(key) + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(audio)
+        os.replace(tmp_path, self._file(key))
+
+    async def add(self, key: str, audio: bytes):
+        if self.max_bytes <= 0 or key in self._files:
+            return
+        try:
+            await asyncio.to_thread(self._write, key, audio)
+        except OSError as e:
+            logger.warning(f"Failed to spill audio {key} to disk: {e}")
+            return
+        self._track(key, len(audio))
+
+def _spill_evicted_audio(key: str, audio: bytes):
+    run_in_background(audio_spill.add(key, audio))
 
 # Global state management
-audio_cache: Dict[str, bytes] = {}
-call_transcripts: Dict[str, List[str]] = {}
+audio_spill = AudioSpill(
+    os.path.join(config.AUDIO_SPILL_DIR, TTS_VOICE_TAG), config.AUDIO_SPILL_MAX_BYTES, TTS_FILE_SUFFIX
+)
+audio_cache = BoundedAudioCache(config.AUDIO_CACHE_MAX_BYTES, on_evict=_spill_evicted_audio)
+# Calls in progress, oldest first; finished calls move to transcript_store
+call_transcripts: "OrderedDict[str, Dict]" = OrderedDict()
 caller_history: Dict[str, Dict] = {}
 
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+_bg_tasks: set = set()
+
+def run_in_background(coro) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it (e.g. SMS sends that shouldn't delay TwiML)"""
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+    return task
+
 # Connection manager for WebSocket streams
 class ConnectionManager:
     def __init__(self):
@@ -92,6 +392,52 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+async def receive_frame(websocket: WebSocket):
+    """
+    Payload of the next WebSocket message as the server delivered it: str for
+    text frames, bytes for binary. orjson parses either directly, so this skips
+    receive_text()'s per-message checks on the 50 frames/sec media path.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    text = message.get("text")
+    return text if text is not None else message["bytes"]
+
+class MediaInbox:
+    """
+    Reads a media stream WebSocket in the background so the handler can take
+    every message that arrived while it was busy (Twilio sends 50 frames/sec)
+    and handle them as one batch.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.reader = asyncio.create_task(self._read(websocket))
+
+    async def _read(self, websocket: WebSocket):
+        try:
+            while True:
+                self.queue.put_nowait(await receive_frame(websocket))
+        except Exception as e:
+            # Hand disconnects (and other receive errors) to the handler after the queued messages
+            self.queue.put_nowait(e)
+
+    async def next_batch(self) -> list:
+        """At least one message, plus any others already waiting"""
+        batch = [await self.queue.get()]
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        if isinstance(batch[-1], Exception):
+            if len(batch) == 1:
+                raise batch[0]
+            # Deliver what arrived before the error first; raise it on the next call
+            self.queue.put_nowait(batch.pop())
+        return batch
+
+    def close(self):
+        self.reader.cancel()
+
 # Initialize Simple TTS globally at startup
 import asyncio
 _tts_initialized = False
@@ -113,6 +459,100 @@ async def ensure_tts_initialized():
             logger.error(f"❌ GLOBAL TTS INIT ERROR: {e}")
     return _tts_initialized
 
+# Whisper + TTS for the Coqui media stream. Loading takes seconds (model weights), so it's
+# done once - at startup when the Coqui system is enabled - and every connection shares it.
+_coqui_models_lock = asyncio.Lock()
+_coqui_models_ready = False
+
+async def ensure_coqui_models() -> bool:
+    """Load the Coqui stream's models once; concurrent callers wait for the same load"""
+    global _coqui_models_ready
+    async with _coqui_models_lock:
+        if _coqui_models_ready:
+            return True
+        
+        # Pin BLAS/OpenMP threads before torch / ctranslate2 are first imported
+        os.environ.setdefault("OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // 4)))
+        try:
+            from whisper_transcription import initialize_whisper
+        except ImportError as e:
+            logger.error(f"❌ Coqui dependencies not available: {e}")
+            logger.error("Install with: pip install TTS faster-whisper torch numpy")
+            return False
+        
+        logger.info("🔧 Initializing SIMPLE TTS system...")
+        tts_ready = await ensure_tts_initialized()
+        try:
+            whisper_ready = await initialize_whisper("base")
+        except:
+            logger.warning("⚠️ Whisper initialization failed, continuing without transcription")
+            whisper_ready = True
+        
+        _coqui_models_ready = tts_ready and whisper_ready
+        return _coqui_models_ready
+
+# Sentence boundary (whitespace after . ! or ?), compiled once for the webhook hot path
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+TOPIC_MAX_CHARS = 50
+
+def topic_from_speech(speech: str) -> str:
+    """Short topic label for caller history: the first sentence, truncated"""
+    return SENTENCE_SPLIT.split(speech, 1)[0][:TOPIC_MAX_CHARS]
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence for sentence in SENTENCE_SPLIT.split(text) if sentence.strip()]
+
+# Streamed sentences shorter than this wait for more text (avoids speaking "Oh." on its own)
+SENTENCE_MIN_CHARS = 10
+# A period after these doesn't end the sentence
+SENTENCE_ABBREVIATIONS = frozenset({"mr.", "mrs.", "ms.", "dr.", "st.", "vs.", "etc.", "e.g.", "i.e."})
+
+class SentenceBuffer:
+    """
+    Accumulates streamed LLM text and hands back each sentence once it's complete.
+
+    A sentence ends at . ! or ? followed by whitespace, so decimals ("3.5")
+    never split and a trailing period waits for the next token.
+    """
+    __slots__ = ('text',)
+
+    def __init__(self):
+        self.text = ""
+
+    def feed(self, delta: str) -> List[str]:
+        self.text += delta
+        sentences = []
+        start = 0
+        for boundary in SENTENCE_SPLIT.finditer(self.text):
+            candidate = self.text[start:boundary.start()].strip()
+            if len(candidate) < SENTENCE_MIN_CHARS or candidate.rsplit(None, 1)[-1].lower() in SENTENCE_ABBREVIATIONS:
+                continue
+            sentences.append(candidate)
+            start = boundary.end()
+        self.text = self.text[start:]
+        return sentences
+
+    def flush(self) -> str:
+        rest = self.text.strip()
+        self.text = ""
+        return rest
+
+async def openai_sentences(messages: List[Dict], **options) -> AsyncIterator[str]:
+    """Stream a chat completion, yielding each sentence as soon as the model finishes it"""
+    if openai_client is None:
+        raise RuntimeError("OPENAI_API_KEY is not set")
+    sentences = SentenceBuffer()
+    # Held until the stream ends: the request is in flight for all of it
+    async with _openai_semaphore:
+        stream = await openai_client.chat.completions.create(messages=messages, stream=True, **options)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                for sentence in sentences.feed(chunk.choices[0].delta.content):
+                    yield sentence
+    rest = sentences.flush()
+    if rest:
+        yield rest
+
 # Inspiring quotes
 # Quick acknowledgment responses (instant, while thinking)
 QUICK_RESPONSES = [
@@ -136,6 +576,9 @@ INSPIRING_QUOTES = [
     "The goal of art isn't to attain perfection. The goal is to share who we are and how we see the world. One of the greatest rewards of making art is our ability to share it. Even if there is no audience to receive it, we build the muscle of making something and putting it out into the world. - Rick Rubin"
 ]
 
+# Each quote as it's spoken, split the way replies are so its sentences can be prewarmed
+QUOTE_SENTENCES = [split_sentences(f"Want to hear an inspiring quote? {quote}") for quote in INSPIRING_QUOTES]
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "message": "Replicant Jason hotline is running"}
@@ -152,8 +595,7 @@ async def streaming_health_check():
     }
     
     if config.USE_STREAMING:
-        ws_url = config.BASE_URL.replace("https://", "wss://").replace("http://", "ws://")
-        health_status["websocket_url"] = f"{ws_url}/media-stream"
+        health_status["websocket_url"] = MEDIA_STREAM_URL
         
         if health_status["elevenlabs_configured"]:
             health_status["status"] = "ready"
@@ -283,39 +725,79 @@ async def websocket_test_client():
     """
     return HTMLResponse(content=html_content)
 
+# Memoized: the fixed phrases (greetings, acknowledgements, quote sentences, fillers)
+# are hashed on every use, and a str caches its own hash, so a hit skips encode + BLAKE2b
+@functools.lru_cache(maxsize=1024)
+def tts_cache_key(text: str) -> str:
+    """Content hash of the TTS text, used as both the audio_cache key and the /audio/{id} path (24 hex chars)"""
+    return hashlib.blake2b(text.encode(), digest_size=12).hexdigest()
+
+_AUDIO_ID = re.compile(r"[0-9a-f]{24}")
+
+# Voice, key and format are fixed for the process, so the REST endpoint and headers are
+# built once. /stream sends audio as it's generated.
+ELEVENLABS_TTS_URL = (
+    f"https://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}/stream"
+    f"?optimize_streaming_latency=4&output_format={TTS_OUTPUT_FORMAT}"
+)
+ELEVENLABS_TTS_HEADERS = {
+    "Accept": TTS_MEDIA_TYPE,
+    "Content-Type": "application/json",
+    "xi-api-key": config.ELEVEN_LABS_API_KEY
+}
+
+# Anything shorter is a truncated or error body, not speech: 512 bytes is ~130ms of
+# MP3 (~65ms of µ-law). Deliberately well under real clips, since the shortest
+# sentences we speak ("Cool.") are only ~2KB of MP3 themselves.
+MIN_TTS_AUDIO_BYTES = 512
+
+def _plausible_audio_start(chunk: bytes) -> bool:
+    """Whether a response starts like audio: an ID3 tag or MPEG frame sync (raw µ-law has no header)"""
+    if TTS_FILE_SUFFIX != ".mp3":
+        return True
+    return chunk[:3] == b"ID3" or (len(chunk) > 1 and chunk[0] == 0xFF and chunk[1] & 0xE0 == 0xE0)
+
+# Connect fails fast so a down ElevenLabs falls back to <Say> quickly; reads
+# are per chunk, so a long reply isn't cut off
+ELEVENLABS_TTS_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
 async def generate_speech_with_elevenlabs(text: str) -> str:
     try:
-        text_hash = hashlib.md5(text.encode()).hexdigest()
-        url = f"https://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}"
-        
-        headers = {
-            "Accept": "audio/mpeg",
-            "Content-Type": "application/json",
-            "xi-api-key": config.ELEVEN_LABS_API_KEY
-        }
-        
-        data = {
-            "text": text,
-            "model_id": "eleven_flash_v2_5",  # Fastest model
-            "voice_settings": {
-                "stability": 0.3,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True
-            },
-            "optimize_streaming_latency": 4  # Maximum speed optimization
-        }
-        
-        async with httpx.AsyncClient(timeout=5.0) as client:  # Allow time for flash model
-            response = await client.post(url, json=data, headers=headers)
-            
-            if response.status_code == 200:
-                audio_data = response.content
-                audio_cache[text_hash] = audio_data
-                return f"{config.BASE_URL}/audio/{text_hash}"
-            else:
+        text_hash = tts_cache_key(text)
+        body = b'{"text":' + orjson.dumps(text) + b',' + ELEVENLABS_TTS_BODY_TAIL
+        
+        # Relay chunks to /audio/{id} as they arrive when a request is waiting on this text
+        stream = _tts_streams.get(text_hash)
+        chunks = []
+        size = relayed = 0
+        async with http_client.stream(
+            "POST", ELEVENLABS_TTS_URL, content=body, headers=ELEVENLABS_TTS_HEADERS,
+            timeout=ELEVENLABS_TTS_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
                 logger.error(f"ElevenLabs API error: {response.status_code}")
                 return None
+            async for chunk in response.aiter_bytes(4096):
+                # Nothing is relayed until the body has started like audio and passed
+                # MIN_TTS_AUDIO_BYTES, so an error or stub body never reaches Twilio
+                # (a stream cut off later still relays what it got, but isn't cached)
+                if not chunks and not _plausible_audio_start(chunk):
+                    logger.error(f"ElevenLabs returned non-audio for '{text[:50]}...': {chunk[:32]!r}")
+                    return None
+                chunks.append(chunk)
+                size += len(chunk)
+                if stream is not None and size >= MIN_TTS_AUDIO_BYTES:
+                    for pending in chunks[relayed:]:
+                        stream.feed(pending)
+                    relayed = len(chunks)
+        
+        # Never cache a stub body: the phrase would stay broken for every later caller
+        if size < MIN_TTS_AUDIO_BYTES:
+            logger.error(f"ElevenLabs returned only {size} bytes for '{text[:50]}...'")
+            return None
+        audio_data = b''.join(chunks)
+        audio_cache[text_hash] = audio_data
+        return AUDIO_URL_PREFIX + text_hash
                 
     except Exception as e:
         logger.error(f"ElevenLabs error: {e}")
@@ -326,14 +808,17 @@ async def generate_speech_with_elevenlabs_streaming(text: str) -> str:
         if not text.strip():
             return None
             
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        text_hash = tts_cache_key(text)
         
         # Check cache first
         if text_hash in audio_cache:
-            return f"{config.BASE_URL}/audio/{text_hash}"
+            return AUDIO_URL_PREFIX + text_hash
         
         # WebSocket streaming connection
-        uri = f"wss://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}/stream-input"
+        uri = (
+            f"wss://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}/stream-input"
+            f"?output_format={TTS_OUTPUT_FORMAT}"
+        )
         
         try:
             async with websockets.connect(uri) as websocket:
@@ -373,7 +858,7 @@ async def generate_speech_with_elevenlabs_streaming(text: str) -> str:
                     full_audio = b''.join(audio_chunks)
                     audio_cache[text_hash] = full_audio
                     logger.info(f"Streaming TTS generated {len(full_audio)} bytes for text: {text[:50]}...")
-                    return f"{config.BASE_URL}/audio/{text_hash}"
+                    return AUDIO_URL_PREFIX + text_hash
                 else:
                     logger.error("No audio chunks received from streaming")
                     return None
@@ -401,42 +886,241 @@ async def generate_speech(text: str) -> str:
         logger.info("Using optimized REST API for TTS")
         return await generate_speech_with_elevenlabs(text)
 
-async def stream_speech_to_twilio(text: str, twilio_websocket: WebSocket, stream_sid: str):
-    """Stream TTS audio directly to Twilio WebSocket with proper MP3 to µ-law conversion"""
+# In-flight generations by text hash: concurrent calls asking for the same phrase
+# share one ElevenLabs request instead of each making their own
+_tts_inflight: Dict[str, asyncio.Future] = {}
+
+class AudioStream:
+    """
+    Audio for one in-flight generation as it arrives (MP3 chunks, or µ-law
+    payloads for media streams), so readers can start relaying it to Twilio
+    before ElevenLabs has finished the whole clip.
+    """
+    __slots__ = ('chunks', 'done', '_changed')
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.done = False
+        self._changed = asyncio.Event()
+
+    def _wake(self):
+        # Fresh event per change, so any number of readers can wait without clearing it on each other
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def feed(self, chunk: bytes):
+        self.chunks.append(chunk)
+        self._wake()
+
+    def finish(self):
+        self.done = True
+        self._wake()
+
+    async def wait(self, seen: int, timeout: float) -> bool:
+        """Wait for chunks past the first `seen` (or the end); False on timeout"""
+        changed = self._changed
+        if len(self.chunks) > seen or self.done:
+            return True
+        try:
+            await asyncio.wait_for(changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def iter_chunks(self, timeout: float) -> AsyncIterator[bytes]:
+        seen = 0
+        while True:
+            while seen < len(self.chunks):
+                yield self.chunks[seen]
+                seen += 1
+            if self.done or not await self.wait(seen, timeout):
+                return
+
+# Partial audio for in-flight generations, by text hash (filled by the REST path)
+_tts_streams: Dict[str, AudioStream] = {}
+
+# Queue distinct requests behind ElevenLabs' concurrent-request cap instead of getting 429s
+_tts_semaphore = asyncio.Semaphore(config.ELEVEN_LABS_MAX_CONCURRENCY)
+
+def _tts_redis_key(text_hash: str) -> str:
+    # Tagged with the voice, settings and format, so a voice change doesn't serve
+    # the old voice's clips until they expire
+    return f"tts:{TTS_VOICE_TAG}:{text_hash}"
+
+async def _store_tts_in_redis(text_hash: str):
+    audio_data = audio_cache.peek(text_hash)
+    if audio_data is None:
+        return  # Already evicted locally
     try:
-        if not text.strip():
-            logger.warning("Empty text provided to stream_speech_to_twilio")
+        await redis_client.set(_tts_redis_key(text_hash), audio_data, ex=config.TTS_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Failed to store TTS audio in Redis: {e}")
+
+async def load_cached_audio(text_hash: str) -> Optional[bytes]:
+    """Look up generated audio locally, then in Redis (populating the local cache on a hit)"""
+    audio_data = audio_cache.get(text_hash)
+    if audio_data is None and redis_client is not None:
+        try:
+            audio_data = await redis_client.get(_tts_redis_key(text_hash))
+        except Exception as e:
+            logger.warning(f"Redis TTS cache lookup failed: {e}")
+            return None
+        if audio_data is not None:
+            audio_cache[text_hash] = audio_data
+    return audio_data
+
+async def _generate_into(text_hash: str, text: str, future: asyncio.Future):
+    result = None
+    try:
+        if audio_spill.path(text_hash) is not None or await load_cached_audio(text_hash) is not None:
+            result = AUDIO_URL_PREFIX + text_hash
             return
+        async with _tts_semaphore:
+            result = await generate_speech(text)
+        if not result:
+            _schedule_tts_retry(text_hash, text)
+        elif redis_client is not None and text_hash in audio_cache:
+            run_in_background(_store_tts_in_redis(text_hash))
+    finally:
+        # Waiters get None (-> <Say> fallback) if generation failed or was cancelled
+        future.set_result(result)
+        _tts_inflight.pop(text_hash, None)
+        stream = _tts_streams.pop(text_hash)
+        if not stream.chunks and result:
+            # Came from a cache or a path that doesn't relay chunks
+            audio_data = audio_cache.peek(text_hash)
+            if audio_data is not None:
+                stream.feed(audio_data)
+        stream.finish()
+
+# After a failed generation the caller hears the <Say> fallback, and the phrase is
+# retried in the background so the next request for it finds audio cached. Retries
+# are capped per phrase for the life of the process (counts kept for the most
+# recent TTS_RETRY_TRACKED phrases), so a text ElevenLabs keeps rejecting isn't
+# retried forever.
+TTS_RETRY_LIMIT = 3
+TTS_RETRY_BACKOFF = 0.5  # seconds before the first retry, doubled after each
+TTS_RETRY_TRACKED = 1024
+_tts_retry_counts: "OrderedDict[str, int]" = OrderedDict()
+_tts_retrying: set = set()
+
+def _schedule_tts_retry(text_hash: str, text: str):
+    if text_hash in _tts_retrying or _tts_retry_counts.get(text_hash, 0) >= TTS_RETRY_LIMIT:
+        return
+    _tts_retrying.add(text_hash)
+    run_in_background(_retry_generation(text_hash, text))
 
-        logger.info(f"Starting ElevenLabs streaming for: '{text[:50]}...'")
+async def _retry_generation(text_hash: str, text: str):
+    try:
+        while (attempt := _tts_retry_counts.get(text_hash, 0)) < TTS_RETRY_LIMIT:
+            _tts_retry_counts[text_hash] = attempt + 1
+            _tts_retry_counts.move_to_end(text_hash)
+            while len(_tts_retry_counts) > TTS_RETRY_TRACKED:
+                _tts_retry_counts.popitem(last=False)
+            
+            await asyncio.sleep(TTS_RETRY_BACKOFF * 2 ** attempt)
+            if await asyncio.shield(_shared_generation(text_hash, text)):
+                logger.info(f"Regenerated audio after a failure: '{text[:50]}...'")
+                return
+        logger.warning(f"Giving up on audio for '{text[:50]}...' after {TTS_RETRY_LIMIT} retries")
+    finally:
+        _tts_retrying.discard(text_hash)
+
+def _shared_generation(text_hash: str, text: str) -> asyncio.Future:
+    """Start generating text's audio, or join the generation already in flight"""
+    pending = _tts_inflight.get(text_hash)
+    if pending is None:
+        pending = _tts_inflight[text_hash] = asyncio.get_running_loop().create_future()
+        _tts_streams[text_hash] = AudioStream()
+        run_in_background(_generate_into(text_hash, text, pending))
+    return pending
+
+async def cached_generate_speech(text: str) -> str:
+    """generate_speech() behind a content-addressed cache, so repeated phrases skip ElevenLabs"""
+    text_hash = tts_cache_key(text)
+    if text_hash in audio_cache or audio_spill.path(text_hash) is not None:
+        return AUDIO_URL_PREFIX + text_hash
+    
+    pending = _shared_generation(text_hash, text)
+    # Hand out the URL as soon as audio starts arriving: /audio/{id} relays the rest
+    # while it's generated, so the TwiML needn't wait for the whole clip. A generation
+    # that fails before its first chunk still returns None (-> <Say> fallback).
+    stream = _tts_streams.get(text_hash)
+    if stream is not None:
+        if await stream.wait(0, FIRST_AUDIO_TIMEOUT) and stream.chunks:
+            return AUDIO_URL_PREFIX + text_hash
+        if not stream.done:
+            # Still silent: the caller hears <Say> now rather than more dead air, and
+            # the generation carries on so the next request finds it cached
+            logger.warning(f"No audio after {FIRST_AUDIO_TIMEOUT}s for '{text[:50]}...', using <Say>")
+            return None
+    
+    # shield() so one waiter being cancelled doesn't cancel the shared result
+    return await asyncio.shield(pending)
 
-        # Import audio conversion dependencies
-        from pydub import AudioSegment
-        import io
+async def speech_url(text: str) -> Optional[str]:
+    """
+    URL to <Play> for text.
 
-        # WebSocket streaming connection to ElevenLabs
-        uri = f"wss://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}/stream-input"
-        logger.debug(f"Connecting to ElevenLabs: {uri}")
-
-        async with websockets.connect(uri) as elevenlabs_ws:
-            # Send initial message with auth and voice settings
-            # Request MP3 output format (ElevenLabs default)
-            init_message = {
-                "text": " ",  # Small initial text
-                "voice_settings": {
-                    "stability": 0.3,
-                    "similarity_boost": 0.75,
-                    "style": 0.0,
-                    "use_speaker_boost": True
-                },
-                "generation_config": {
-                    "chunk_length_schedule": [120, 160, 250, 290]
-                },
-                "xi_api_key": config.ELEVEN_LABS_API_KEY
-            }
-            logger.debug("Sending ElevenLabs init message")
-            await elevenlabs_ws.send(json.dumps(init_message))
+    With USE_EARLY_PLAY the URL is returned as soon as generation has started -
+    it's derived from the text, so it's known up front - and /audio/{id} waits
+    for the audio. Twilio fetches it while we'd otherwise still be waiting on
+    ElevenLabs, at the cost of the <Say> fallback if generation fails.
+    """
+    if not config.USE_EARLY_PLAY:
+        return await cached_generate_speech(text)
+    
+    text_hash = tts_cache_key(text)
+    if text_hash not in audio_cache and audio_spill.path(text_hash) is None:
+        _shared_generation(text_hash, text)
+    return AUDIO_URL_PREFIX + text_hash
 
+async def _send_text_stream(elevenlabs_ws, sentences: AsyncIterator[str]):
+    """Forward sentences to an ElevenLabs stream-input socket as they arrive, then end the stream"""
+    try:
+        async for sentence in sentences:
+            logger.debug(f"Sending sentence to ElevenLabs: {sentence}")
+            # flush: synthesize what we have now instead of waiting for more text
+            await elevenlabs_ws.send(json.dumps({"text": sentence + " ", "flush": True}))
+    except Exception as e:
+        logger.error(f"Text stream for ElevenLabs failed: {e}")
+    finally:
+        # Send EOS (end of stream) even on failure, so the audio side finishes
+        with contextlib.suppress(websockets.exceptions.ConnectionClosed):
+            await elevenlabs_ws.send(json.dumps({"text": ""}))
+
+async def elevenlabs_mulaw_payloads(text) -> AsyncIterator[str]:
+    """
+    Yield base64 µ-law payloads (20ms frames) for Twilio as ElevenLabs streams text.
+
+    text is either a string or an async iterator of sentences (e.g. a streamed
+    LLM reply), which are sent on as they arrive so speech starts with the
+    first sentence.
+    """
+    # Ask for Twilio's wire format directly (8kHz µ-law), so there's no MP3 decode/resample
+    uri = f"wss://api.elevenlabs.io/v1/text-to-speech/{config.ELEVEN_LABS_VOICE_ID}/stream-input?output_format=ulaw_8000"
+    logger.debug(f"Connecting to ElevenLabs: {uri}")
+
+    async with websockets.connect(uri) as elevenlabs_ws:
+        # Send initial message with auth and voice settings
+        init_message = {
+            "text": " ",  # Small initial text
+            "voice_settings": {
+                "stability": 0.3,
+                "similarity_boost": 0.75,
+                "style": 0.0,
+                "use_speaker_boost": True
+            },
+            "generation_config": {
+                "chunk_length_schedule": [120, 160, 250, 290]
+            },
+            "xi_api_key": config.ELEVEN_LABS_API_KEY
+        }
+        logger.debug("Sending ElevenLabs init message")
+        await elevenlabs_ws.send(json.dumps(init_message))
+
+        sender = None
+        if isinstance(text, str):
             # Send the actual text
             logger.debug(f"Sending text to ElevenLabs: {text}")
             await elevenlabs_ws.send(json.dumps({"text": text}))
@@ -444,24 +1128,32 @@ async def stream_speech_to_twilio(text: str, twilio_websocket: WebSocket, stream
             # Send EOS (end of stream)
             logger.debug("Sending EOS to ElevenLabs")
             await elevenlabs_ws.send(json.dumps({"text": ""}))
+        else:
+            sender = asyncio.create_task(_send_text_stream(elevenlabs_ws, text))
 
-            # Stream audio chunks with proper conversion
-            chunk_count = 0
-            total_mp3_bytes = 0
-            total_mulaw_bytes = 0
+        # Stream audio chunks, re-cut into Twilio-sized frames
+        chunk_count = 0
+        total_mulaw_bytes = 0
+        # Tail of the last chunk that didn't fill a whole frame
+        pending = b''
 
-            # Add timeout to prevent hanging forever
-            timeout_seconds = 30
-            start_time = time.time()
+        # For log lines (a sentence stream has no text up front)
+        label = text[:50] if isinstance(text, str) else "(streamed reply)"
+
+        # Add timeout to prevent hanging forever
+        timeout_seconds = 30
+        start_time = time.time()
 
+        try:
             async for message in elevenlabs_ws:
                 # Check timeout
                 if time.time() - start_time > timeout_seconds:
                     logger.warning(f"ElevenLabs streaming timeout after {timeout_seconds}s, {chunk_count} chunks received")
                     break
                 try:
-                    data = json.loads(message)
-                    logger.debug(f"ElevenLabs response: {list(data.keys())}")
+                    data = _loads(message)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("ElevenLabs response: %s", list(data.keys()))
 
                     # Check for errors first
                     if data.get("error"):
@@ -470,160 +1162,397 @@ async def stream_speech_to_twilio(text: str, twilio_websocket: WebSocket, stream
 
                     if data.get("audio"):
                         chunk_count += 1
-                        audio_b64 = data["audio"]
-
-                        try:
-                            # Step 1: Decode base64 to get MP3 bytes
-                            mp3_bytes = base64.b64decode(audio_b64)
-                            total_mp3_bytes += len(mp3_bytes)
-                            logger.debug(f"Chunk {chunk_count}: Decoded {len(mp3_bytes)} MP3 bytes")
-
-                            # Step 2: Decode MP3 to PCM audio using pydub
-                            audio_segment = AudioSegment.from_mp3(io.BytesIO(mp3_bytes))
-
-                            # Step 3: Resample to 8kHz mono (Twilio requirement)
-                            audio_segment = audio_segment.set_frame_rate(8000).set_channels(1)
-
-                            # Step 4: Export as WAV
-                            wav_buffer = io.BytesIO()
-                            audio_segment.export(wav_buffer, format="wav")
-                            wav_bytes = wav_buffer.getvalue()
-                            logger.debug(f"Chunk {chunk_count}: Converted to {len(wav_bytes)} WAV bytes")
-
-                            # Step 5: Convert WAV to µ-law using existing function
-                            mulaw_bytes = convert_wav_to_mulaw(wav_bytes)
-                            total_mulaw_bytes += len(mulaw_bytes)
-
-                            # Step 6: Encode as base64 for Twilio
-                            mulaw_b64 = base64.b64encode(mulaw_bytes).decode('ascii')
-                            logger.debug(f"Chunk {chunk_count}: Converted to {len(mulaw_bytes)} µ-law bytes")
-
-                        except Exception as conversion_error:
-                            logger.error(f"Failed to convert audio chunk {chunk_count}: {conversion_error}")
-                            continue
-
-                        # Step 7: Send properly formatted audio to Twilio
-                        media_message = {
-                            "event": "media",
-                            "streamSid": stream_sid,
-                            "media": {
-                                "payload": mulaw_b64  # Proper µ-law format for Twilio
-                            }
-                        }
-
-                        try:
-                            # Check if WebSocket is still connected before sending
-                            if twilio_websocket.client_state.name == "CONNECTED":
-                                await twilio_websocket.send_text(json.dumps(media_message))
-                                logger.debug(f"✅ Sent converted audio chunk {chunk_count} to Twilio")
-                                # Small delay to prevent overwhelming the connection
-                                await asyncio.sleep(0.01)  # 10ms delay for faster streaming (was 20ms)
-                            else:
-                                logger.warning(f"Twilio WebSocket not connected (state: {twilio_websocket.client_state.name}), skipping chunk")
-                                # Don't break - try to continue in case connection recovers
-                        except websockets.exceptions.ConnectionClosed:
-                            logger.warning(f"Twilio WebSocket closed, stopping audio stream")
-                            break  # Connection definitively closed
-                        except Exception as send_error:
-                            logger.warning(f"Failed to send audio chunk to Twilio: {send_error}")
-                            # Don't break on transient errors - keep trying
+                        mulaw_bytes = _b64decode(data["audio"])
+                        total_mulaw_bytes += len(mulaw_bytes)
+                        logger.debug("Chunk %d: %d µ-law bytes", chunk_count, len(mulaw_bytes))
+
+                        pending += mulaw_bytes
+                        whole = len(pending) - len(pending) % AudioBuffer.FRAME_BYTES
+                        with memoryview(pending) as view:
+                            frames = [
+                                _b64frame(view[offset:offset + AudioBuffer.FRAME_BYTES])
+                                for offset in range(0, whole, AudioBuffer.FRAME_BYTES)
+                            ]
+                        pending = pending[whole:]
+                        for payload in frames:
+                            yield payload
 
                     if data.get("isFinal"):
                         logger.info(f"✅ Finished streaming: {chunk_count} chunks")
-                        logger.info(f"   MP3 input: {total_mp3_bytes} bytes")
                         logger.info(f"   µ-law output: {total_mulaw_bytes} bytes")
-                        logger.info(f"   Text: '{text[:50]}...'")
+                        logger.info(f"   Text: '{label}...'")
                         break
 
-                except json.JSONDecodeError as json_error:
+                except orjson.JSONDecodeError as json_error:
                     logger.error(f"Invalid JSON from ElevenLabs: {json_error}")
                 except Exception as chunk_error:
-                    logger.error(f"Error processing ElevenLabs chunk: {chunk_error}")
-                    import traceback
-                    logger.error(f"Chunk error traceback: {traceback.format_exc()}")
+                    logger.exception(f"Error processing ElevenLabs chunk: {chunk_error}")
+
+            if pending:
+                yield _b64frame(pending)
+        finally:
+            if sender is not None:
+                sender.cancel()
+
+        # Log completion even if isFinal never arrived
+        logger.info(f"✅ ElevenLabs stream ended: {chunk_count} chunks")
+        if chunk_count > 0:
+            logger.info(f"   µ-law output: {total_mulaw_bytes} bytes")
+            logger.info(f"   Text: '{label}...'")
+
+@functools.lru_cache(maxsize=256)
+def media_frame_template(stream_sid: str) -> tuple:
+    """JSON before and after the payload of a media message; only the payload changes per frame"""
+    prefix = '{"event":"media","streamSid":' + _dumps(stream_sid) + ',"media":{"payload":"'
+    return prefix, '"}}'
+
+# 10ms between 20ms frames: faster than realtime so Twilio's buffer stays ahead (was 20ms)
+MEDIA_SEND_INTERVAL = 0.01
+
+class FramePacer:
+    """
+    Fixed-rate send clock for one utterance.
+
+    Waits until an absolute deadline (previous deadline + interval) instead of
+    sleeping a fixed amount after each send, so send latency doesn't add up over
+    a long utterance. If the producer stalls and we fall behind, the clock
+    restarts from now rather than bursting to catch up.
+    """
+    __slots__ = ("interval", "deadline")
+
+    def __init__(self, interval: float = MEDIA_SEND_INTERVAL):
+        self.interval = interval
+        self.deadline = None
+
+    async def wait(self):
+        now = asyncio.get_running_loop().time()
+        if self.deadline is None or self.deadline < now:
+            self.deadline = now
+        self.deadline += self.interval
+        await asyncio.sleep(self.deadline - now)
+
+async def send_media_payload(twilio_websocket: WebSocket, stream_sid: str, payload: str, pacer: Optional[FramePacer] = None) -> bool:
+    """Send one base64 µ-law payload to Twilio. Returns False once the socket is closed."""
+    # Base64 never needs JSON escaping, so splice it in instead of building and encoding a dict
+    prefix, suffix = media_frame_template(stream_sid)
+
+    try:
+        # Check if WebSocket is still connected before sending
+        if twilio_websocket.client_state.name == "CONNECTED":
+            await twilio_websocket.send_text(prefix + payload + suffix)
+            # Small delay to prevent overwhelming the connection
+            if pacer is not None:
+                await pacer.wait()
+            else:
+                await asyncio.sleep(MEDIA_SEND_INTERVAL)
+        else:
+            logger.warning(f"Twilio WebSocket not connected (state: {twilio_websocket.client_state.name}), skipping chunk")
+            # Don't break - try to continue in case connection recovers
+    except websockets.exceptions.ConnectionClosed:
+        logger.warning(f"Twilio WebSocket closed, stopping audio stream")
+        return False  # Connection definitively closed
+    except Exception as send_error:
+        logger.warning(f"Failed to send audio chunk to Twilio: {send_error}")
+        # Don't break on transient errors - keep trying
+    return True
+
+async def send_paced(twilio_websocket: WebSocket, messages: List[str], interval: float):
+    """
+    Send pre-serialized media messages one every `interval` seconds.
+
+    Deadlines are absolute (start + n * interval), so time spent sending doesn't
+    push the schedule back; any frames that fell due while we were busy go out
+    back to back in the same turn.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time()
+    sent = 0
+    while sent < len(messages):
+        now = loop.time()
+        while sent < len(messages) and deadline <= now:
+            await twilio_websocket.send_text(messages[sent])
+            sent += 1
+            deadline += interval
+        if sent < len(messages):
+            await asyncio.sleep(deadline - loop.time())
+
+# Twilio-ready µ-law payloads by voice + phrase. Greetings are pre-generated, and everything
+# streamed (fillers, greetings, repeated replies) is kept so the next time it's replayed
+# without another ElevenLabs round trip. LRU-bounded, and shared through Redis when
+# REDIS_URL is set so every worker benefits from what any one of them generated.
+MULAW_FRAME_CACHE_SIZE = 500
+mulaw_frame_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+
+def frame_cache_key(text: str, voice: Optional[str] = None) -> str:
+    # Whitespace differences don't change what gets said
+    normalized = " ".join(text.split())
+    return tts_cache_key(f"{voice or config.ELEVEN_LABS_VOICE_ID}:{normalized}")
+
+def mulaw_frames(mulaw_data: bytes) -> List[str]:
+    """Cut raw µ-law into base64 20ms frames for Twilio"""
+    # memoryview slices are views, so each frame is encoded without first copying it out
+    view = memoryview(mulaw_data)
+    return [
+        _b64frame(view[i:i + AudioBuffer.FRAME_BYTES])
+        for i in range(0, len(mulaw_data), AudioBuffer.FRAME_BYTES)
+    ]
+
+def _frames_redis_key(key: str) -> str:
+    return f"tts:ulaw:{key}"
 
-            # Log completion even if isFinal never arrived
-            logger.info(f"✅ ElevenLabs stream ended: {chunk_count} chunks sent")
-            if chunk_count > 0:
-                logger.info(f"   MP3 input: {total_mp3_bytes} bytes")
-                logger.info(f"   µ-law output: {total_mulaw_bytes} bytes")
-                logger.info(f"   Text: '{text[:50]}...'")
+def _store_frames(key: str, payloads: List[str]):
+    mulaw_frame_cache[key] = payloads
+    while len(mulaw_frame_cache) > MULAW_FRAME_CACHE_SIZE:
+        mulaw_frame_cache.popitem(last=False)
 
+async def _store_frames_in_redis(key: str, payloads: List[str]):
+    # Stored as raw µ-law (a third smaller than base64); NX since every worker may prewarm the same phrase
+    mulaw_data = b''.join(_b64decode(payload) for payload in payloads)
+    try:
+        await redis_client.set(_frames_redis_key(key), mulaw_data, ex=config.TTS_CACHE_TTL, nx=True)
+    except Exception as e:
+        logger.warning(f"Failed to store µ-law frames in Redis: {e}")
+
+async def get_cached_frames(text: str, voice: Optional[str] = None) -> Optional[List[str]]:
+    """Cached payloads for text: this process first, then Redis (populating the local cache on a hit)"""
+    key = frame_cache_key(text, voice)
+    payloads = mulaw_frame_cache.get(key)
+    if payloads is not None:
+        mulaw_frame_cache.move_to_end(key)
+    elif redis_client is not None:
+        try:
+            mulaw_data = await redis_client.get(_frames_redis_key(key))
+        except Exception as e:
+            logger.warning(f"Redis µ-law cache lookup failed: {e}")
+            return None
+        if mulaw_data:
+            payloads = mulaw_frames(mulaw_data)
+            _store_frames(key, payloads)
+    return payloads
+
+def cache_frames(text: str, payloads: List[str], voice: Optional[str] = None):
+    key = frame_cache_key(text, voice)
+    _store_frames(key, payloads)
+    if redis_client is not None:
+        run_in_background(_store_frames_in_redis(key, payloads))
+
+async def send_cached_frames(twilio_websocket: WebSocket, stream_sid: str, text: str, voice: Optional[str] = None) -> bool:
+    """Replay pre-converted payloads for text. Returns False if text isn't cached."""
+    payloads = await get_cached_frames(text, voice)
+    if payloads is None:
+        return False
+    pacer = FramePacer()
+    for payload in payloads:
+        if not await send_media_payload(twilio_websocket, stream_sid, payload, pacer):
+            break
+    return True
+
+async def stream_speech_to_twilio(text: str, twilio_websocket: WebSocket, stream_sid: str):
+    """Stream ElevenLabs µ-law audio directly to the Twilio WebSocket"""
+    try:
+        if not text.strip():
+            logger.warning("Empty text provided to stream_speech_to_twilio")
+            return
+
+        if await send_cached_frames(twilio_websocket, stream_sid, text):
+            logger.info(f"Replayed cached audio for: '{text[:50]}...'")
+            return
+
+        pacer = FramePacer()
+        async for payload in shared_speech_frames(text).iter_chunks(AUDIO_PENDING_TIMEOUT):
+            if not await send_media_payload(twilio_websocket, stream_sid, payload, pacer):
+                break
+
+    except Exception as e:
+        logger.exception(f"Error in stream_speech_to_twilio: {e}")
+
+async def stream_sentences_to_twilio(sentences: AsyncIterator[str], twilio_websocket: WebSocket, stream_sid: str):
+    """Speak sentences as they're produced (e.g. by openai_sentences) over one ElevenLabs stream"""
+    try:
+        pacer = FramePacer()
+        async with contextlib.aclosing(elevenlabs_mulaw_payloads(sentences)) as payloads:
+            async for payload in payloads:
+                if not await send_media_payload(twilio_websocket, stream_sid, payload, pacer):
+                    break
     except websockets.exceptions.WebSocketException as ws_error:
         logger.error(f"ElevenLabs WebSocket error: {ws_error}")
+
+MEDIA_STREAM_GREETING = "Hey! This is Synthetic Jason speaking in real-time! I can hear you clearly and respond instantly. What's on your mind?"
+MEDIA_STREAM_TEST_RESPONSE = "I heard you! This may sound distorted due to audio format issues."
+
+# µ-law generations in flight, by frame_cache_key: calls that need the same text at
+# the same time (the greeting after a deploy, fillers) follow one ElevenLabs stream
+_frames_inflight: Dict[str, AudioStream] = {}
+
+async def _generate_frames_into(key: str, text: str, stream: AudioStream):
+    try:
+        # Same ElevenLabs concurrency cap as the TwiML path: both count against the plan
+        async with _tts_semaphore:
+            logger.info(f"Starting ElevenLabs streaming for: '{text[:50]}...'")
+            async with contextlib.aclosing(elevenlabs_mulaw_payloads(text)) as payloads:
+                async for payload in payloads:
+                    stream.feed(payload)
+        if stream.chunks:
+            cache_frames(text, stream.chunks)
     except Exception as e:
-        logger.error(f"Error in stream_speech_to_twilio: {e}")
-        import traceback
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.error(f"ElevenLabs streaming failed for '{text[:50]}...': {e}")
+    finally:
+        _frames_inflight.pop(key, None)
+        stream.finish()
+
+def shared_speech_frames(text: str) -> AudioStream:
+    """
+    Start generating text's µ-law frames, or join the generation already in
+    flight. It runs independently of any one call, so a caller hanging up
+    doesn't cut off the others (and the finished audio still gets cached).
+    """
+    key = frame_cache_key(text)
+    stream = _frames_inflight.get(key)
+    if stream is None:
+        stream = _frames_inflight[key] = AudioStream()
+        run_in_background(_generate_frames_into(key, text, stream))
+    return stream
+
+async def prewarm_elevenlabs_frames(text: str):
+    """Generate and convert text once so calls can replay it without waiting on ElevenLabs"""
+    payloads = [payload async for payload in shared_speech_frames(text).iter_chunks(AUDIO_PENDING_TIMEOUT)]
+    if payloads:
+        logger.info(f"🔥 Pre-generated {len(payloads)} frames for: '{text[:50]}...'")
+    else:
+        logger.warning(f"Failed to pre-generate audio for '{text[:50]}...'")
+
+async def prewarm_fixed_phrases():
+    """Pre-generate every phrase a media stream can say verbatim: greeting, test reply, fillers"""
+    from caller_memory import FILLER_WORDS
+    
+    # One at a time, so prewarming never competes with live calls for ElevenLabs concurrency
+    for text in (MEDIA_STREAM_GREETING, MEDIA_STREAM_TEST_RESPONSE, *FILLER_WORDS):
+        if await get_cached_frames(text) is None:
+            await prewarm_elevenlabs_frames(text)
+
+async def prewarm_twiml_phrases():
+    """Generate and pin the audio the TwiML flow plays verbatim, so /voice never waits on it"""
+    for text in TWIML_FIXED_PHRASES:
+        text_hash = tts_cache_key(text)
+        audio_cache.pin(text_hash)
+        # The whole generation, not cached_generate_speech: nobody's waiting on the call
+        if not await asyncio.shield(_shared_generation(text_hash, text)):
+            logger.warning(f"Failed to pre-generate audio for '{text[:50]}...'")
+            continue
+        # Also on disk, so after a restart they're served with sendfile straight
+        # away (never loaded into memory) instead of waiting on ElevenLabs again
+        audio_data = audio_cache.peek(text_hash)
+        if audio_data is not None:
+            await audio_spill.add(text_hash, audio_data)
+
+async def prewarm_all_phrases():
+    await prewarm_twiml_phrases()
+    await prewarm_fixed_phrases()
+
+@app.on_event("startup")
+async def prewarm_greetings():
+    # In the background so startup doesn't wait on ElevenLabs; early calls just stream live
+    if config.ELEVEN_LABS_API_KEY and config.ELEVEN_LABS_VOICE_ID:
+        run_in_background(prewarm_all_phrases())
+
+# Minimum seconds between repeated "dropping audio" warnings for one stream
+OVERFLOW_LOG_INTERVAL = 5.0
+
+# Received-audio batches a Coqui stream may queue for transcription before dropping
+ASR_QUEUE_MAX_BATCHES = 250
 
 class AudioBuffer:
+    """
+    Ring buffer of inbound μ-law audio for one media stream.
+
+    Preallocated once and written in place, so the 50 frames/sec path doesn't
+    grow/trim a list or re-join chunks. Only the owning stream's task touches
+    it, so there's no locking. When full, the oldest audio is overwritten.
+    """
+    FRAME_BYTES = 160  # Twilio sends 20ms frames: 160 bytes of 8kHz μ-law
+
+    __slots__ = (
+        'capacity', 'buf', 'write_idx', 'filled', 'process_threshold',
+        'silence_threshold', 'last_chunk_time', 'last_response_time',
+        'dropped_bytes', 'last_overflow_log'
+    )
+
     def __init__(self, max_chunks=50):
-        self.chunks = []
-        self.max_chunks = max_chunks
+        self.capacity = max_chunks * self.FRAME_BYTES
+        self.buf = bytearray(self.capacity)
+        self.write_idx = 0
+        self.filled = 0
+        self.process_threshold = 10 * self.FRAME_BYTES  # ~200ms of audio
         self.silence_threshold = 3  # seconds of silence before processing
         self.last_chunk_time = None
+        self.last_response_time = 0.0  # time.monotonic() of our last reply, 0.0 if none yet
+        self.dropped_bytes = 0  # overwritten before being processed, since the last warning
+        self.last_overflow_log = 0.0
     
     def add_chunk(self, audio_data: bytes):
-        self.chunks.append(audio_data)
-        self.last_chunk_time = time.time()
-        
-        # Keep buffer size manageable
-        if len(self.chunks) > self.max_chunks:
-            self.chunks = self.chunks[-self.max_chunks:]
+        data = memoryview(audio_data)
+        if len(data) > self.capacity:
+            data = data[-self.capacity:]
+        n = len(data)
+        
+        # Full: the oldest audio gets overwritten (memory stays fixed, latency stays bounded)
+        overflow = self.filled + n - self.capacity
+        if overflow > 0:
+            self._note_overflow(overflow)
+        
+        # Write up to the end of the buffer, then wrap to the start
+        first = min(n, self.capacity - self.write_idx)
+        self.buf[self.write_idx:self.write_idx + first] = data[:first]
+        if first < n:
+            self.buf[:n - first] = data[first:]
+        
+        self.write_idx = (self.write_idx + n) % self.capacity
+        self.filled = min(self.filled + n, self.capacity)
+        self.last_chunk_time = time.monotonic()
+    
+    def _note_overflow(self, nbytes: int):
+        # Warn at most once per interval, not on every frame while processing is behind
+        self.dropped_bytes += nbytes
+        now = time.monotonic()
+        if now - self.last_overflow_log >= OVERFLOW_LOG_INTERVAL:
+            logger.warning(f"Audio buffer full - dropped {self.dropped_bytes} bytes of oldest audio")
+            self.dropped_bytes = 0
+            self.last_overflow_log = now
     
     def should_process(self) -> bool:
-        if not self.chunks:
+        if not self.filled:
             return False
         
         # Process if we have enough audio or if there's been silence
-        if len(self.chunks) >= 10:  # ~0.5 seconds of audio
+        if self.filled >= self.process_threshold:
             return True
         
-        if self.last_chunk_time and (time.time() - self.last_chunk_time) > self.silence_threshold:
+        if self.last_chunk_time and (time.monotonic() - self.last_chunk_time) > self.silence_threshold:
             return True
             
         return False
     
     def get_audio_data(self) -> bytes:
-        if self.chunks:
-            return b''.join(self.chunks)
-        return b''
+        """Buffered audio in arrival order (a copy, since the buffer is reused after clear())"""
+        view = memoryview(self.buf)
+        start = (self.write_idx - self.filled) % self.capacity
+        if start + self.filled <= self.capacity:
+            return view[start:start + self.filled].tobytes()
+        return view[start:].tobytes() + view[:self.write_idx].tobytes()
     
     def clear(self):
-        self.chunks = []
-
-def convert_wav_to_mulaw(wav_data: bytes) -> bytes:
-    """
-    Convert WAV audio to raw µ-law format for Twilio WebSocket.
-
-    Uses wave module to properly parse headers (handles any header size).
-    """
-    import audioop
-    import wave
-    import io
-
-    # Use wave module to properly parse WAV (handles 44, 78, or any byte headers)
-    wav_buffer = io.BytesIO(wav_data)
-    with wave.open(wav_buffer, 'rb') as wav_file:
-        # Extract pure PCM data (no matter what header size)
-        pcm_data = wav_file.readframes(wav_file.getnframes())
-
-    # Convert 16-bit linear PCM to µ-law (8-bit)
-    mulaw_data = audioop.lin2ulaw(pcm_data, 2)
-
-    return mulaw_data
+        self.filled = 0
 
 async def transcribe_audio_buffer(audio_data: bytes) -> str:
     """Transcribe audio using OpenAI Whisper API"""
     try:
-        if len(audio_data) < 1000:  # Need substantial audio
+        if len(audio_data) < 1000 or openai_client is None:  # Need substantial audio (and a key)
             return ""
 
         # Convert µ-law to WAV for Whisper API
         import audioop
         import wave
         import io
-        import tempfile
 
         # µ-law audio from Twilio is 8kHz, 8-bit
         # Convert to 16-bit PCM for WAV
@@ -639,40 +1568,24 @@ async def transcribe_audio_buffer(audio_data: bytes) -> str:
 
         wav_data = wav_buffer.getvalue()
 
-        # Save to temp file for OpenAI API (requires file upload)
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_file.write(wav_data)
-            temp_path = temp_file.name
-
-        try:
-            # Call OpenAI Whisper API
-            from openai import OpenAI
-            client = OpenAI(api_key=config.OPENAI_API_KEY)
-
-            with open(temp_path, 'rb') as audio_file:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en",
-                    prompt="Conversation about art, creative projects, AI, technology. Common words: generative, glitch, aesthetic, algorithm, neural network, synthetic.",
-                    response_format="text"
-                )
-
-            # With response_format="text", transcript is a string directly
-            transcription = transcript.strip() if isinstance(transcript, str) else transcript.text.strip()
-            logger.info(f"🎤 Transcription: '{transcription}'")
-            return transcription
+        # Call OpenAI Whisper API (the upload is sent from memory as a named file)
+        async with _openai_semaphore:
+            transcript = await openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=("audio.wav", wav_data),
+                language="en",
+                prompt="Conversation about art, creative projects, AI, technology. Common words: generative, glitch, aesthetic, algorithm, neural network, synthetic.",
+                response_format="text"
+            )
 
-        finally:
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        # With response_format="text", transcript is a string directly
+        transcription = transcript.strip() if isinstance(transcript, str) else transcript.text.strip()
+        logger.info(f"🎤 Transcription: '{transcription}'")
+        return transcription
 
     except Exception as e:
-        logger.error(f"Transcription error: {e}")
-        import traceback
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        # Traceback only formatted when debug logging is on
+        logger.error(f"Transcription error: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
         return ""
 
 # Store audio buffers per stream
@@ -697,12 +1610,35 @@ log_capture = LogCapture()
 log_capture.setLevel(logging.DEBUG)
 logger.addHandler(log_capture)
 
+# How long /audio/{id} waits on a generation that's still in flight (for its
+# first audio, then between chunks)
+AUDIO_PENDING_TIMEOUT = 10.0
+# How long a TwiML response waits for a generation's first audio before falling back to <Say>
+FIRST_AUDIO_TIMEOUT = 4.0
+
 @app.get("/audio/{audio_id}")
 async def serve_audio(audio_id: str):
-    if audio_id in audio_cache:
+    # Every id we hand out is a tts_cache_key; anything else can't be cached
+    # anywhere, so skip the Redis round trip for it
+    if not _AUDIO_ID.fullmatch(audio_id):
+        return Response(status_code=404)
+    if audio_id not in audio_cache:
+        spilled = audio_spill.path(audio_id)
+        if spilled is not None:
+            return FileResponse(spilled, media_type=TTS_MEDIA_TYPE, headers={"Cache-Control": "public, max-age=3600"})
+    audio_data = await load_cached_audio(audio_id)
+    stream = _tts_streams.get(audio_id) if audio_data is None else None
+    if stream is not None:
+        # Hold the response until there's audio, so a failed generation is still a 404
+        if not await stream.wait(0, AUDIO_PENDING_TIMEOUT):
+            logger.warning(f"Timed out waiting for audio {audio_id}")
+        if stream.chunks:
+            return StreamingResponse(stream.iter_chunks(AUDIO_PENDING_TIMEOUT), media_type=TTS_MEDIA_TYPE)
+        audio_data = audio_cache.get(audio_id)
+    if audio_data is not None:
         return Response(
-            content=audio_cache[audio_id],
-            media_type="audio/mpeg",
+            content=audio_data,
+            media_type=TTS_MEDIA_TYPE,
             headers={"Cache-Control": "public, max-age=3600"}
         )
     else:
@@ -712,20 +1648,23 @@ async def generate_call_summary(conversation: list) -> str:
     try:
         if not conversation:
             return "No conversation recorded"
+        if openai_client is None:
+            return "Summary unavailable"
         
         conversation_text = ""
         for exchange in conversation:
             conversation_text += f"Caller: {exchange['caller']}\nAI: {exchange['ai']}\n\n"
         
-        summary_response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "Summarize this phone conversation between a caller and Replicant Jason (an AI version of artist Jason Huff) in 1-2 sentences. Focus on the main topics discussed and any interesting ideas or projects mentioned."},
-                {"role": "user", "content": conversation_text}
-            ],
-            max_tokens=100,
-            temperature=0.3
-        )
+        async with _openai_semaphore:
+            summary_response = await openai_client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": "Summarize this phone conversation between a caller and Replicant Jason (an AI version of artist Jason Huff) in 1-2 sentences. Focus on the main topics discussed and any interesting ideas or projects mentioned."},
+                    {"role": "user", "content": conversation_text}
+                ],
+                max_tokens=100,
+                temperature=0.3
+            )
         
         return summary_response.choices[0].message.content.strip()
     except Exception as e:
@@ -748,7 +1687,9 @@ async def send_sms_notification(caller_number: str, is_returning: bool = False,
         else:
             message = f"📞 Replicant Jason call at {timestamp}\nNew caller: {caller_number}"
         
-        twilio_client.messages.create(
+        # Twilio's REST client is synchronous; keep it off the event loop
+        await asyncio.to_thread(
+            twilio_client.messages.create,
             body=message,
             from_=TWILIO_PHONE_NUMBER,
             to=YOUR_PHONE_NUMBER
@@ -761,13 +1702,14 @@ async def send_sms_notification(caller_number: str, is_returning: bool = False,
         logger.error(f"Failed to send SMS notification: {e}")
         return False
 
-async def send_call_summary_sms(caller_number: str, call_sid: str) -> bool:
+async def send_call_summary_sms(caller_number: str, call_sid: str, conversation: Optional[list] = None) -> bool:
     try:
-        if not YOUR_PHONE_NUMBER or call_sid not in call_transcripts:
-            return False
+        if conversation is None:
+            if call_sid not in call_transcripts:
+                return False
+            conversation = call_transcripts[call_sid]['conversation']
         
-        conversation = call_transcripts[call_sid]['conversation']
-        if not conversation:
+        if not YOUR_PHONE_NUMBER or not conversation:
             return False
         
         summary = await generate_call_summary(conversation)
@@ -775,7 +1717,9 @@ async def send_call_summary_sms(caller_number: str, call_sid: str) -> bool:
         
         message = f"📋 Call Summary ({timestamp})\nCaller: {caller_number}\n\n{summary}"
         
-        twilio_client.messages.create(
+        # Twilio's REST client is synchronous; keep it off the event loop
+        await asyncio.to_thread(
+            twilio_client.messages.create,
             body=message,
             from_=TWILIO_PHONE_NUMBER,
             to=YOUR_PHONE_NUMBER
@@ -788,31 +1732,278 @@ async def send_call_summary_sms(caller_number: str, call_sid: str) -> bool:
         logger.error(f"Failed to send call summary SMS: {e}")
         return False
 
-async def get_ai_response(user_input: str, caller_context: str = "") -> str:
+JASON_SYSTEM_PROMPT = "You are Replicant Jason, a synthetic version of artist Jason Huff. You're obsessed with making things, not talking about making things. You hate tech buzzwords and Silicon Valley bullshit. You're direct, honest, and a bit sarcastic. You get excited about clever ideas that take real thinking to execute. You like art that helps people see technology's impact in new ways without being cheesy. Keep responses SHORT and conversational - like you're chatting with a friend, not giving a lecture. Avoid numbered lists or structured formats. Give ONE idea or thought at a time. Be practical and focused on ideas that actually make people think. Don't ask multiple questions in one response."
+# Built once and sent first in every request; caller context goes in its own message
+# after it, so the persona prefix is byte-identical across calls (what OpenAI's
+# prompt caching matches on)
+JASON_SYSTEM_MESSAGE = {"role": "system", "content": JASON_SYSTEM_PROMPT}
+
+_NON_WORD = re.compile(r"[^\w\s']")
+
+def normalize_question(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace (Twilio's transcripts vary in all three)"""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+# Fixed replies to one-word turns, by normalized utterance. GPT has nothing to go on
+# for these anyway, and the replies are prewarmed, so the turn costs no API calls.
+FAST_REPLIES = {
+    "yes": "Love that energy. Tell me more about what you're thinking.",
+    "yeah": "Love that energy. Tell me more about what you're thinking.",
+    "sure": "Love that energy. Tell me more about what you're thinking.",
+    "okay": "Cool. So what's on your mind?",
+    "ok": "Cool. So what's on your mind?",
+    "no": "Fair enough. What would you rather talk about?",
+    "nope": "Fair enough. What would you rather talk about?",
+    "hello": "Hey, I'm here! What are you working on these days?",
+    "hi": "Hey, I'm here! What are you working on these days?",
+    "hey": "Hey, I'm here! What are you working on these days?",
+    "uh": "Take your time. I'm listening.",
+    "um": "Take your time. I'm listening.",
+    "hmm": "Take your time. I'm listening.",
+}
+
+# Replies kept for repeat questions, and how fast an entry's use count fades
+AI_RESPONSE_CACHE_SIZE = 1024
+AI_RESPONSE_DECAY_PER_HOUR = 0.9
+
+class AIResponseCache:
+    """
+    GPT replies by prompt + question, evicted least-used first with uses
+    decayed by age (LFU with decay). A question asked on every call outlives a
+    burst of one-offs, but stops being protected once people stop asking it.
+    """
+    __slots__ = ('_entries', 'max_entries')
+
+    def __init__(self, max_entries: int):
+        # key -> [reply, uses, last_used]
+        self._entries: Dict[str, list] = {}
+        self.max_entries = max_entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _score(entry: list, now: float) -> float:
+        return entry[1] * AI_RESPONSE_DECAY_PER_HOUR ** ((now - entry[2]) / 3600)
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        entry[1] = self._score(entry, now) + 1
+        entry[2] = now
+        return entry[0]
+
+    def put(self, key: str, reply: str):
+        now = time.monotonic()
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            # Only runs after a GPT call, so a scan of ~1k entries is noise next to it
+            victim = min(self._entries, key=lambda k: self._score(self._entries[k], now))
+            del self._entries[victim]
+        self._entries[key] = [reply, 1.0, now]
+
+ai_response_cache = AIResponseCache(AI_RESPONSE_CACHE_SIZE)
+
+# GPT requests in flight by response-cache key
+_ai_inflight: Dict[str, asyncio.Future] = {}
+
+AI_FALLBACK_TEXT = "Sorry, I'm having trouble thinking right now. Can you say that again?"
+
+def _chat_messages(caller_context: str, user_input: str) -> List[Dict]:
+    messages = [JASON_SYSTEM_MESSAGE]
+    if caller_context:
+        messages.append({"role": "system", "content": f"CALLER CONTEXT: {caller_context}"})
+    messages.append({"role": "user", "content": user_input})
+    return messages
+
+async def ai_response_sentences(user_input: str, caller_context: str = "") -> AsyncIterator[str]:
+    """Yield the reply one sentence at a time, as GPT finishes each one"""
+    question = normalize_question(user_input)
+    fast_reply = FAST_REPLIES.get(question)
+    if fast_reply is not None:
+        for sentence in split_sentences(fast_reply):
+            yield sentence
+        return
+    
+    # 15% chance to offer a quote
+    if random.random() < 0.15:
+        for sentence in random.choice(QUOTE_SENTENCES):
+            yield sentence
+        return
+    
+    # Same caller context + same question (ignoring case/punctuation) -> same reply
+    # (the persona is fixed for the process)
+    cache_key = tts_cache_key(f"{caller_context}\n{question}")
+    reply = ai_response_cache.get(cache_key)
+    if reply is None:
+        pending = _ai_inflight.get(cache_key)
+        if pending is not None:
+            # The same question asked again before the first answer is back joins that request;
+            # shield() so one waiter being cancelled doesn't cancel the shared request
+            reply = await asyncio.shield(pending)
+    if reply is not None:
+        for sentence in split_sentences(reply):
+            yield sentence
+        return
+    
+    pending = _ai_inflight[cache_key] = asyncio.get_running_loop().create_future()
+    sentences: List[str] = []
     try:
-        # 15% chance to offer a quote
-        if random.random() < 0.15:
-            quote = random.choice(INSPIRING_QUOTES)
-            return f"Want to hear an inspiring quote? {quote}"
-        
-        system_prompt = "You are Replicant Jason, a synthetic version of artist Jason Huff. You're obsessed with making things, not talking about making things. You hate tech buzzwords and Silicon Valley bullshit. You're direct, honest, and a bit sarcastic. You get excited about clever ideas that take real thinking to execute. You like art that helps people see technology's impact in new ways without being cheesy. Keep responses SHORT and conversational - like you're chatting with a friend, not giving a lecture. Avoid numbered lists or structured formats. Give ONE idea or thought at a time. Be practical and focused on ideas that actually make people think. Don't ask multiple questions in one response."
-        
-        if caller_context:
-            system_prompt += f" CALLER CONTEXT: {caller_context}"
-        
-        chat_response = openai.ChatCompletion.create(
+        async for sentence in openai_sentences(
+            _chat_messages(caller_context, user_input),
             model="gpt-4o-mini",  # Faster than gpt-3.5-turbo-1106
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_input}
-            ],
             max_tokens=80,  # Much shorter, more conversational
+            stop=["\n\n"],  # One paragraph is all a phone reply needs
             temperature=0.7
-        )
-        return chat_response.choices[0].message.content.strip()
+        ):
+            sentences.append(sentence)
+            yield sentence
+        ai_response_cache.put(cache_key, " ".join(sentences))
     except Exception as e:
         logger.error(f"OpenAI API error: {e}")
-        return "Sorry, I'm having trouble thinking right now. Can you say that again?"
+        if not sentences:
+            yield AI_FALLBACK_TEXT
+    finally:
+        _ai_inflight.pop(cache_key, None)
+        if not pending.done():
+            pending.set_result(" ".join(sentences) or AI_FALLBACK_TEXT)
+
+async def get_ai_response(user_input: str, caller_context: str = "") -> str:
+    return " ".join([sentence async for sentence in ai_response_sentences(user_input, caller_context)])
+
+MAX_TRACKED_TOPICS = 10
+
+# Webhooks take a raw time.time() and only format it for the records that keep it
+# (a new caller or call, a recorded turn), so most requests never build the string
+def iso_timestamp(ts: float) -> str:
+    """Local ISO-8601 time for a time.time() value (what transcripts and caller history store)"""
+    return datetime.fromtimestamp(ts).isoformat()
+
+def record_caller(from_number: str, ts: float) -> Dict:
+    """Create or bump this caller's caller_history entry and return it"""
+    caller_info = caller_history.get(from_number)
+    if caller_info is None:
+        caller_info = caller_history[from_number] = {
+            'first_call': iso_timestamp(ts),
+            'call_count': 1,
+            'last_topics': deque(maxlen=MAX_TRACKED_TOPICS)
+        }
+    else:
+        caller_info['call_count'] += 1
+    return caller_info
+
+# Most calls kept in memory at once. Past this the oldest is persisted early: it's a
+# call whose end-of-call status callback never arrived. If it turns out to be live,
+# its next turn reopens it, and save_transcripts merges the two pieces.
+MAX_ACTIVE_TRANSCRIPTS = 500
+# Most turns kept per call; a longer call keeps its most recent ones
+MAX_CONVERSATION_TURNS = 200
+
+def start_transcript(call_sid: str, from_number: str, ts: float):
+    """Open call_sid's in-memory transcript if it isn't already"""
+    if call_sid in call_transcripts:
+        return
+    call_transcripts[call_sid] = {
+        'from_number': from_number,
+        'start_time': iso_timestamp(ts),
+        'conversation': []
+    }
+    while len(call_transcripts) > MAX_ACTIVE_TRANSCRIPTS:
+        _transcript_flush_queue.put_nowait(call_transcripts.popitem(last=False))
+
+NO_SPEECH_TEXT = "I couldn't catch what you said. Talk to you later!"
+
+# Twilio voice for <Say> when ElevenLabs audio isn't available (Polly's neural male
+# voice is much closer to the ElevenLabs one than Twilio's basic "man")
+FALLBACK_VOICE = "Polly.Matthew-Neural"
+
+# Serialized "say goodbye and hang up" TwiML, keyed by audio URL (or fallback text).
+# These documents never change for a given URL, so build them once.
+_hangup_twiml_cache: Dict[str, str] = {}
+
+def hangup_twiml(audio_url: Optional[str], fallback_text: str) -> str:
+    """Return TwiML that plays audio_url (or says fallback_text) and hangs up"""
+    key = audio_url or fallback_text
+    twiml = _hangup_twiml_cache.get(key)
+    if twiml is None:
+        response = VoiceResponse()
+        if audio_url:
+            response.play(audio_url)
+        else:
+            response.say(fallback_text, voice=FALLBACK_VOICE)
+        response.hangup()
+        twiml = _hangup_twiml_cache[key] = str(response)
+    return twiml
+
+# Per-call verbs, spliced into the templates below
+def play_or_say_twiml(audio_url: Optional[str], fallback_text: str, voice: str = FALLBACK_VOICE) -> str:
+    if audio_url:
+        return f"<Play>{html.escape(audio_url)}</Play>"
+    return f'<Say voice="{voice}">{html.escape(fallback_text)}</Say>'
+
+def twiml_template(response: VoiceResponse) -> str:
+    """Serialize a response once, with {before} and {after} slots for the verbs that change per call"""
+    return str(response).replace("<Response>", "<Response>{before}", 1).replace("</Response>", "{after}</Response>", 1)
+
+def _gather_twiml_template(action: str, speech_timeout: int, timeout: int, **gather_options) -> str:
+    response = VoiceResponse()
+    response.gather(
+        input='speech',
+        action=action,
+        method='POST',
+        speech_timeout=speech_timeout,
+        timeout=timeout,
+        **gather_options
+    )
+    return twiml_template(response)
+
+def _stream_twiml(stream_url: str, announcement: Optional[str] = None) -> str:
+    response = VoiceResponse()
+    if announcement:
+        response.say(announcement)
+    response.connect().stream(url=stream_url)
+    return str(response)
+
+# Only the prompt around the <Gather> changes between calls, so the XML is built once at import
+ELEVENLABS_GATHER_TWIML = _gather_twiml_template(
+    '/process-speech-elevenlabs',  # Route to ElevenLabs processor
+    speech_timeout=2,  # Slightly longer to reduce interruptions
+    timeout=10  # Give more time for responses
+)
+# Fully static documents are stored encoded, so responses send them as-is
+COQUI_STREAM_TWIML = _stream_twiml(COQUI_STREAM_URL).encode()
+STATIC_KILLER_TWIML = _stream_twiml(STATIC_KILLER_STREAM_URL, "Connecting to Static Killer test system...").encode()
+# The stream host follows the request's Host header
+REALTIME_STREAM_TWIML = _stream_twiml("wss://{host}/realtime-stream")
+ELEVENLABS_TIMEOUT_TEXT = "I didn't catch that. Talk to you later!"
+NEW_CALLER_GREETING = "Hey! This is Synthetic Jason... I'm basically Jason Huff but weirder and more obsessed with art. What wild idea should we dream up together?"
+RETURNING_CALLER_GREETING = "Hey, welcome back! This is Synthetic Jason... I remember you called before. What's on your mind today?"
+# A returning caller's greeting names their topics, so only its opening can be prewarmed
+RETURNING_CALLER_OPENER = "Hey, welcome back! This is Synthetic Jason..."
+
+# Said word for word on /voice calls; generated at startup and pinned in audio_cache
+TWIML_FIXED_PHRASES = (
+    NEW_CALLER_GREETING, RETURNING_CALLER_GREETING, RETURNING_CALLER_OPENER, ELEVENLABS_TIMEOUT_TEXT, NO_SPEECH_TEXT, AI_FALLBACK_TEXT, *QUICK_RESPONSES,
+    *(sentence for sentences in QUOTE_SENTENCES for sentence in sentences),
+    *dict.fromkeys(sentence for reply in FAST_REPLIES.values() for sentence in split_sentences(reply))
+)
+
+def _redirect_twiml_template(url: str) -> str:
+    response = VoiceResponse()
+    response.redirect(url, method='POST')
+    return twiml_template(response)
+
+# First half of a turn: the acknowledgement plays while the reply is written,
+# then Twilio comes back for it
+ACKNOWLEDGE_TWIML = _redirect_twiml_template('/play-response/{turn_id}')
+
+# Replies still being written, by turn id, until /play-response collects them
+_pending_replies: Dict[str, asyncio.Task] = {}
+# How long /play-response waits on a reply (Twilio gives up on a webhook after 15s)
+REPLY_WAIT_TIMEOUT = 12.0
+# Replies nobody came back for (the caller hung up) are dropped after this
+PENDING_REPLY_TTL = 60.0
 
 @app.api_route("/voice", methods=["GET", "POST"])
 async def handle_call(request: Request):
@@ -830,191 +2021,322 @@ async def handle_elevenlabs_call(request: Request):
     from_number = form_data.get('From', 'unknown')
     call_sid = form_data.get('CallSid', 'unknown')
     
-    response = VoiceResponse()
-    
     # Check if this is a returning caller
-    is_returning = from_number in caller_history
-    topics = caller_history.get(from_number, {}).get('last_topics', []) if is_returning else []
+    caller_info = caller_history.get(from_number)
+    is_returning = caller_info is not None
+    topics = list(caller_info['last_topics']) if is_returning else []
     
-    # Send SMS notification
-    await send_sms_notification(from_number, is_returning, topics)
+    # Send SMS notification in the background so the webhook returns quickly
+    run_in_background(send_sms_notification(from_number, is_returning, topics))
     
     # Initialize call transcript
-    timestamp = datetime.now().isoformat()
-    if call_sid not in call_transcripts:
-        call_transcripts[call_sid] = {
-            'from_number': from_number,
-            'start_time': timestamp,
-            'conversation': []
-        }
+    now = time.time()
+    start_transcript(call_sid, from_number, now)
     
     # Update caller history
-    if from_number not in caller_history:
-        caller_history[from_number] = {
-            'first_call': timestamp,
-            'call_count': 1,
-            'last_topics': []
-        }
-    else:
-        caller_history[from_number]['call_count'] += 1
+    record_caller(from_number, now)
     
     # Traditional approach for ElevenLabs calls
-    if from_number in caller_history:
-        caller_info = caller_history[from_number]
-        call_count = caller_info['call_count']
-        recent_topics = caller_info['last_topics'][-2:] if caller_info['last_topics'] else []
-        
-        if recent_topics:
-            topics_text = " and ".join(recent_topics)
-            greeting_text = f"Hey, welcome back! This is Synthetic Jason... I remember we talked about {topics_text}. Want to pick up where we left off?"
-        else:
-            greeting_text = f"Hey, welcome back! This is Synthetic Jason... I remember you called before. What's on your mind today?"
-    else:
-        greeting_text = "Hey! This is Synthetic Jason... I'm basically Jason Huff but weirder and more obsessed with art. What wild idea should we dream up together?"
-    
-    greeting_audio_url = await generate_speech(greeting_text)
-    
-    if greeting_audio_url:
-        response.play(greeting_audio_url)
+    recent_topics = topics[-2:]
+    if recent_topics:
+        # The prewarmed opener plays while the personalized rest is synthesized
+        topics_text = " and ".join(recent_topics)
+        greeting_texts = [
+            RETURNING_CALLER_OPENER,
+            f"I remember we talked about {topics_text}. Want to pick up where we left off?"
+        ]
+    elif is_returning:
+        greeting_texts = [RETURNING_CALLER_GREETING]
     else:
-        response.say(greeting_text, voice="man")
+        greeting_texts = [NEW_CALLER_GREETING]
     
-    gather = response.gather(
-        input='speech',
-        action='/process-speech-elevenlabs',  # Route to ElevenLabs processor
-        method='POST',
-        speech_timeout=2,  # Slightly longer to reduce interruptions  
-        timeout=10  # Give more time for responses
+    *greeting_audio_urls, timeout_audio_url = await asyncio.gather(
+        *(speech_url(text) for text in greeting_texts),
+        cached_generate_speech(ELEVENLABS_TIMEOUT_TEXT)
     )
     
-    timeout_audio_url = await generate_speech("I didn't catch that. Talk to you later!")
-    if timeout_audio_url:
-        response.play(timeout_audio_url)
-    else:
-        response.say("I didn't catch that. Talk to you later!", voice="man")
-    response.hangup()
-    
-    return HTMLResponse(content=str(response), media_type="application/xml")
-
-@app.api_route("/process-speech", methods=["POST"])
-async def process_speech(request: Request):
+    twiml = ELEVENLABS_GATHER_TWIML.format(
+        before=''.join(
+            play_or_say_twiml(audio_url, text) for audio_url, text in zip(greeting_audio_urls, greeting_texts)
+        ),
+        after=play_or_say_twiml(timeout_audio_url, ELEVENLABS_TIMEOUT_TEXT) + "<Hangup />"
+    )
+    return HTMLResponse(content=twiml, media_type="application/xml")
+
+class TwilioWebhookForm(BaseModel):
+    """The Twilio webhook fields our handlers use, bound once from the POSTed form"""
+    CallSid: str = "unknown"
+    From: str = "unknown"
+    SpeechResult: str = ""
+    CallStatus: str = ""
+
+    @classmethod
+    def as_form(
+        cls,
+        CallSid: str = Form("unknown"),
+        From: str = Form("unknown"),
+        SpeechResult: str = Form(""),
+        CallStatus: str = Form(""),
+    ) -> "TwilioWebhookForm":
+        return cls(CallSid=CallSid, From=From, SpeechResult=SpeechResult, CallStatus=CallStatus)
+
+@app.post("/process-speech")
+async def process_speech(request: Request, form: TwilioWebhookForm = Depends(TwilioWebhookForm.as_form)):
     """Route speech processing based on system type"""
     if config.USE_COQUI_TEST:
         return await process_speech_coqui(request)
     else:
-        return await process_speech_elevenlabs(request)
+        return await process_speech_elevenlabs(form)
 
-@app.api_route("/process-speech-elevenlabs", methods=["POST"])
-async def process_speech_elevenlabs(request: Request):
-    form_data = await request.form()
-    speech_result = form_data.get('SpeechResult', '')
-    call_sid = form_data.get('CallSid', 'unknown')
-    from_number = form_data.get('From', 'unknown')
-    
-    response = VoiceResponse()
+@app.post("/process-speech-elevenlabs")
+async def process_speech_elevenlabs(form: TwilioWebhookForm = Depends(TwilioWebhookForm.as_form)):
+    speech_result = form.SpeechResult
+    call_sid = form.CallSid
+    from_number = form.From
     
     if speech_result:
-        timestamp = datetime.now().isoformat()
+        now = time.time()
         
-        if call_sid not in call_transcripts:
-            call_transcripts[call_sid] = {
-                'from_number': from_number,
-                'start_time': timestamp,
-                'conversation': []
-            }
+        start_transcript(call_sid, from_number, now)
+        # Held directly: the reply lands after this returns, possibly after the call has ended
+        transcript = call_transcripts[call_sid]
+        conversation = transcript['conversation']
         
         # Update caller history
-        if from_number not in caller_history:
-            caller_history[from_number] = {
-                'first_call': timestamp,
-                'call_count': 1,
-                'last_topics': []
-            }
-        else:
-            caller_history[from_number]['call_count'] += 1
+        caller_info = record_caller(from_number, now)
+        call_count = caller_info['call_count']
+        last_topics = caller_info['last_topics']
         
         # Build caller context
-        caller_info = caller_history[from_number]
-        caller_context = f"This caller has called {caller_info['call_count']} time{'s' if caller_info['call_count'] != 1 else ''} before."
-        if caller_info['last_topics']:
-            caller_context += f" Previous topics: {', '.join(caller_info['last_topics'][-3:])}"
-        
-        # Generate AI response with built-in acknowledgment
-        ai_response = await get_ai_response(speech_result, caller_context if caller_info['call_count'] > 1 else "")
+        caller_context = f"This caller has called {call_count} time{'s' if call_count != 1 else ''} before."
+        if last_topics:
+            caller_context += f" Previous topics: {', '.join(list(last_topics)[-3:])}"
         
-        # Prepend a quick acknowledgment to make it feel more responsive
+        # A quick acknowledgment plays straight away (its audio is pinned at startup)
+        # while GPT and ElevenLabs work on the real reply
         quick_response = random.choice(QUICK_RESPONSES)
-        full_response = f"{quick_response} {ai_response}"
-        
-        call_transcripts[call_sid]['conversation'].append({
-            'timestamp': timestamp,
-            'caller': speech_result,
-            'ai': full_response
-        })
         
-        # Track topics for this caller (keep only last 10 topics)
-        caller_history[from_number]['last_topics'].append(speech_result[:50])
-        if len(caller_history[from_number]['last_topics']) > 10:
-            caller_history[from_number]['last_topics'] = caller_history[from_number]['last_topics'][-10:]
-        
-        logger.info(f"Call {call_sid}: Caller said '{speech_result}' | AI replied '{full_response}'")
-        
-        audio_url = await generate_speech(full_response)
+        def record_turn(ai_response: str):
+            full_response = f"{quick_response} {ai_response}"
+            
+            conversation.append({
+                'timestamp': iso_timestamp(now),
+                'caller': speech_result,
+                'ai': full_response
+            })
+            if len(conversation) > MAX_CONVERSATION_TURNS:
+                del conversation[0]
+            
+            # The call ended (and its transcript was queued) while this reply was
+            # being written: queue it again so the write includes this turn
+            if call_transcripts.get(call_sid) is not transcript:
+                _transcript_flush_queue.put_nowait((call_sid, transcript))
+            
+            # Track topics for this caller (the deque keeps only the most recent ones)
+            last_topics.append(topic_from_speech(speech_result))
+            
+            logger.info(f"Call {call_sid}: Caller said '{speech_result}' | AI replied '{full_response}'")
         
-        if audio_url:
-            response.play(audio_url)
-        else:
-            response.say(ai_response, voice="man")
-        
-        gather = response.gather(
-            input='speech',
-            action='/process-speech-elevenlabs',  # Route to ElevenLabs processor
-            method='POST',
-            speech_timeout=2,  # Slightly longer to reduce interruptions  
-            timeout=10  # Give more time for responses
+        async def reply_prompt() -> str:
+            # Each sentence starts synthesizing as soon as GPT finishes it, so
+            # ElevenLabs works on the first sentence while GPT writes the rest
+            sentences: List[str] = []
+            audio_urls = []
+            try:
+                async for sentence in ai_response_sentences(speech_result, caller_context if call_count > 1 else ""):
+                    sentences.append(sentence)
+                    audio_urls.append(asyncio.ensure_future(speech_url(sentence)))
+                
+                # One <Play> per sentence: the sentences synthesize concurrently, so the
+                # reply is ready when its slowest sentence is rather than the whole text
+                audio_urls = await asyncio.gather(*audio_urls)
+                return ''.join(
+                    play_or_say_twiml(audio_url, sentence) for audio_url, sentence in zip(audio_urls, sentences)
+                )
+            finally:
+                # Here rather than in /play-response, so the turn is kept even if nobody
+                # collects the reply (the caller hung up) or synthesis fails
+                record_turn(" ".join(sentences) or AI_FALLBACK_TEXT)
+        
+        turn_id = uuid.uuid4().hex
+        _pending_replies[turn_id] = run_in_background(reply_prompt())
+        asyncio.get_running_loop().call_later(PENDING_REPLY_TTL, _pending_replies.pop, turn_id, None)
+        
+        twiml = ACKNOWLEDGE_TWIML.format(
+            before=play_or_say_twiml(await speech_url(quick_response), quick_response),
+            after="",
+            turn_id=turn_id
         )
+        return HTMLResponse(content=twiml, media_type="application/xml")
     else:
         # Send call summary before hanging up if we have a conversation
         if call_sid in call_transcripts and call_transcripts[call_sid]['conversation']:
-            await send_call_summary_sms(from_number, call_sid)
+            run_in_background(send_call_summary_sms(from_number, call_sid))
+        
+        timeout_audio_url = await cached_generate_speech(NO_SPEECH_TEXT)
+        return HTMLResponse(content=hangup_twiml(timeout_audio_url, NO_SPEECH_TEXT), media_type="application/xml")
+
+@app.post("/play-response/{turn_id}")
+async def play_response(turn_id: str):
+    """Second half of a turn: play the reply once it's ready, then listen again"""
+    prompt = None
+    reply = _pending_replies.pop(turn_id, None)
+    if reply is None:
+        logger.warning(f"No pending reply for turn {turn_id}")
+    else:
+        try:
+            # shield() so a timeout leaves the reply running: it still records the turn
+            prompt = await asyncio.wait_for(asyncio.shield(reply), REPLY_WAIT_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Reply for turn {turn_id} failed: {e}")
+    if prompt is None:
+        # Ask again rather than leave the caller in silence (this audio is pinned)
+        prompt = play_or_say_twiml(await cached_generate_speech(AI_FALLBACK_TEXT), AI_FALLBACK_TEXT)
+    twiml = ELEVENLABS_GATHER_TWIML.format(before=prompt, after="")
+    return HTMLResponse(content=twiml, media_type="application/xml")
+
+# Completed transcripts waiting to be written to transcript_store
+_transcript_flush_queue: asyncio.Queue = asyncio.Queue()
+TRANSCRIPT_FLUSH_BATCH = 100
+TRANSCRIPT_FLUSH_INTERVAL = 1.0  # seconds to wait for more items before writing a batch
+# What the worker has taken off the queue but not written yet. Module-level so the
+# shutdown hook can still write it if the worker is cancelled while holding it.
+_transcript_flush_batch: List[tuple] = []
+_transcript_flush_task: Optional[asyncio.Task] = None
+
+async def _transcript_flush_worker():
+    """Drain completed transcripts from the queue and write them to disk in batches"""
+    batch = _transcript_flush_batch
+    while True:
+        batch.append(await _transcript_flush_queue.get())
+        deadline = time.monotonic() + TRANSCRIPT_FLUSH_INTERVAL
+        while len(batch) < TRANSCRIPT_FLUSH_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_transcript_flush_queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
         
-        timeout_audio_url = await generate_speech("I couldn't catch what you said. Talk to you later!")
-        if timeout_audio_url:
-            response.play(timeout_audio_url)
+        try:
+            await asyncio.to_thread(transcript_store.save_transcripts, batch)
+            logger.info(f"Persisted {len(batch)} call transcript(s)")
+        except Exception as e:
+            logger.error(f"Failed to persist transcripts: {e}")
+        batch.clear()
+
+@app.on_event("startup")
+async def preload_coqui_models():
+    # In the background so the app can serve while weights load; a call arriving
+    # mid-load waits on the same lock instead of loading a second copy
+    if config.USE_COQUI_TEST:
+        run_in_background(ensure_coqui_models())
+
+@app.on_event("startup")
+async def start_transcript_persistence():
+    global _transcript_flush_task
+    await asyncio.to_thread(transcript_store.init_db)
+    _transcript_flush_task = run_in_background(_transcript_flush_worker())
+
+@app.on_event("shutdown")
+async def flush_pending_transcripts():
+    """Write anything still queued (plus calls in progress) before the process exits"""
+    if _transcript_flush_task is not None:
+        _transcript_flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _transcript_flush_task
+    # Whatever the worker was holding (rewriting rows it already saved is harmless:
+    # save_transcripts merges turns into the saved row)
+    batch = list(_transcript_flush_batch)
+    while not _transcript_flush_queue.empty():
+        batch.append(_transcript_flush_queue.get_nowait())
+    batch.extend(call_transcripts.items())
+    if batch:
+        await asyncio.to_thread(transcript_store.save_transcripts, batch)
+
+# Pages with more transcripts than this are JSON-encoded on a worker thread
+TRANSCRIPTS_INLINE_MAX = 100
+# Largest page /transcripts returns, whatever limit is asked for
+TRANSCRIPTS_PAGE_MAX = 500
+
+class TranscriptsGZipMiddleware:
+    """
+    gzip for the transcript endpoints only. Their JSON shrinks several times
+    over, while everything else is either audio that's already compressed
+    (/audio, on every call's hot path) or TwiML too small to be worth it.
+    """
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/transcripts"):
+            await self.gzip(scope, receive, send)
         else:
-            response.say("I couldn't catch what you said. Talk to you later!", voice="man")
-        response.hangup()
-    
-    return HTMLResponse(content=str(response), media_type="application/xml")
+            await self.app(scope, receive, send)
+
+app.add_middleware(TranscriptsGZipMiddleware, minimum_size=1024)
 
 @app.get("/transcripts")
-async def get_transcripts():
-    return {
-        "total_calls": len(call_transcripts),
-        "transcripts": call_transcripts
+async def get_transcripts(limit: int = 50, offset: int = 0):
+    """
+    One page of all calls, newest first: calls in progress, then persisted ones.
+    limit and offset count across both, so a page never holds more than limit.
+    """
+    limit = max(1, min(limit, TRANSCRIPTS_PAGE_MAX))
+    offset = max(0, offset)
+    live_sids = list(reversed(call_transcripts))[offset:offset + limit]
+    transcripts = {call_sid: call_transcripts[call_sid] for call_sid in live_sids}
+    persisted_count = await asyncio.to_thread(transcript_store.count_transcripts)
+    if len(transcripts) < limit:
+        transcripts.update(await asyncio.to_thread(
+            transcript_store.list_transcripts,
+            limit - len(transcripts),
+            max(0, offset - len(call_transcripts))
+        ))
+    body = {
+        "total_calls": len(call_transcripts) + persisted_count,
+        "limit": limit,
+        "offset": offset,
+        "transcripts": transcripts
     }
+    if len(transcripts) <= TRANSCRIPTS_INLINE_MAX:
+        return body
+    # A large page takes long enough to encode to stall
+    # live calls' audio. orjson holds the GIL while it runs, so the in-progress
+    # conversations can't change under it.
+    return Response(content=await asyncio.to_thread(orjson.dumps, body), media_type="application/json")
 
 @app.get("/transcripts/{call_sid}")
 async def get_call_transcript(call_sid: str):
     if call_sid in call_transcripts:
         return call_transcripts[call_sid]
+    
+    transcript = await asyncio.to_thread(transcript_store.get_transcript, call_sid)
+    if transcript:
+        return transcript
     else:
         return {"error": "Call not found"}
 
-@app.api_route("/call-status", methods=["POST"])
-async def handle_call_status(request: Request):
-    form_data = await request.form()
-    call_status = form_data.get('CallStatus', '')
-    call_sid = form_data.get('CallSid', '')
-    from_number = form_data.get('From', 'unknown')
+# Twilio's final call statuses; anything else means the call is still going
+CALL_ENDED_STATUSES = frozenset({'completed', 'busy', 'failed', 'no-answer', 'canceled'})
+
+@app.post("/call-status")
+async def handle_call_status(form: TwilioWebhookForm = Depends(TwilioWebhookForm.as_form)):
+    call_status = form.CallStatus
+    call_sid = form.CallSid
+    from_number = form.From
     
     logger.info(f"Call status update: {call_sid} - {call_status}")
     
-    # Send summary when call ends
-    if call_status == 'completed' and call_sid in call_transcripts:
-        conversation = call_transcripts[call_sid]['conversation']
+    # When the call ends, move its transcript out of memory and send the summary
+    if call_status in CALL_ENDED_STATUSES and call_sid in call_transcripts:
+        transcript = call_transcripts.pop(call_sid)
+        _transcript_flush_queue.put_nowait((call_sid, transcript))
+        conversation = transcript['conversation']
         if conversation:  # Only send summary if there was actual conversation
-            await send_call_summary_sms(from_number, call_sid)
+            run_in_background(send_call_summary_sms(from_number, call_sid, conversation))
     
     return {"status": "received"}
 
@@ -1030,16 +2352,9 @@ async def handle_coqui_call(request: Request):
     
     logger.info(f"🧪 Starting Coqui test call from {from_number}")
     
-    response = VoiceResponse()
-    
     # For now, use Media Streams for bidirectional real-time audio
-    connect = response.connect()
-    ws_url = config.BASE_URL.replace("https://", "wss://").replace("http://", "ws://")
-    stream_url = f"{ws_url}/coqui-stream"
-    logger.info(f"Connecting to Coqui Media Stream: {stream_url}")
-    connect.stream(url=stream_url)
-    
-    return HTMLResponse(content=str(response), media_type="application/xml")
+    logger.info(f"Connecting to Coqui Media Stream: {COQUI_STREAM_URL}")
+    return HTMLResponse(content=COQUI_STREAM_TWIML, media_type="application/xml")
 
 async def process_speech_coqui(request: Request):
     """Coqui-based speech processing (placeholder)"""
@@ -1047,302 +2362,378 @@ async def process_speech_coqui(request: Request):
     # For now, redirect to Media Streams
     return await handle_coqui_call(request)
 
-@app.websocket("/media-stream")
-async def handle_media_stream(websocket: WebSocket):
-    """Handle Twilio Media Streams for real-time bidirectional audio"""
-    stream_sid = None
-    call_sid = None
+class MediaSession:
+    """
+    One Twilio Media Streams connection.
     
-    try:
-        await websocket.accept()
-        logger.info("✅ Media stream WebSocket accepted")
+    Owns the receive loop shared by every media-stream endpoint: accept the
+    socket, read events in batches, dispatch them to the on_* hooks, clean up.
+    Subclasses decide what to say and what to do with the caller's audio.
+    """
+    name = "Media stream"
+    
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.stream_sid = None
+        self.call_sid = None
+        self.inbox = None
+    
+    async def prepare(self) -> bool:
+        """Load whatever the session needs before accepting. False rejects the connection."""
+        return True
+    
+    async def on_accept(self):
+        pass
+    
+    async def on_start(self, start: dict):
+        pass
+    
+    async def on_media(self, chunks: List[bytes]):
+        """Decoded μ-law frames from one batch of media events, in arrival order"""
+        pass
+    
+    async def on_closed(self):
+        pass
+    
+    async def run(self):
+        if not await self.prepare():
+            return
+        
+        try:
+            await self.websocket.accept()
+            logger.info(f"✅ {self.name} WebSocket accepted")
+            # No socket tuning needed for 20ms frames: asyncio sets TCP_NODELAY on every
+            # TCP transport it creates (uvicorn's included), so Nagle is already off
+            
+            await self.on_accept()
+            self.inbox = MediaInbox(self.websocket)
+            
+            while True:
+                media_chunks = []
+                closed = False
+                
+                for message in await self.inbox.next_batch():
+                    data = _loads(message)
+                    event = data.get('event', 'unknown')
+                    logger.debug("%s received: %s", self.name, event)
+                    
+                    if event == 'connected':
+                        logger.info(f"✅ {self.name} connected")
+                    
+                    elif event == 'start':
+                        self.stream_sid = data['start']['streamSid']
+                        self.call_sid = data['start']['callSid']
+                        logger.info(f"🚀 {self.name} started: {self.stream_sid} for call {self.call_sid}")
+                        await self.on_start(data['start'])
+                    
+                    elif event == 'media':
+                        # Extract stream_sid from media event if we don't have it
+                        if not self.stream_sid:
+                            self.stream_sid = data.get('streamSid')
+                            logger.info(f"🔍 Extracted stream_sid from media event: {self.stream_sid}")
+                        
+                        # Receive μ-law audio from Twilio (8kHz, base64)
+                        media_chunks.append(_b64decode(data['media']['payload']))
+                    
+                    elif event == 'closed':
+                        logger.info(f"{self.name} closed: {self.stream_sid}")
+                        closed = True
+                        break
+                
+                # Hand the whole batch over at once rather than frame by frame
+                if media_chunks:
+                    await self.on_media(media_chunks)
+                
+                if closed:
+                    break
+        
+        except WebSocketDisconnect:
+            logger.info(f"{self.name} WebSocket disconnected")
+        except Exception as e:
+            logger.exception(f"{self.name} error: {e}")
+        finally:
+            if self.inbox:
+                self.inbox.close()
+            await self.on_closed()
+
+class ElevenLabsMediaSession(MediaSession):
+    """Media stream answered with ElevenLabs streaming TTS"""
+    
+    def __init__(self, websocket: WebSocket):
+        super().__init__(websocket)
+        # Add fallback mechanism - if streaming fails, we can fallback to traditional approach
+        self.fallback_triggered = False
+        # Track if we've sent the initial greeting
+        self.greeting_sent = False
+    
+    async def send_greeting(self):
+        # Streamed via ElevenLabs, or replayed from cache once pre-generated
+        try:
+            await stream_speech_to_twilio(MEDIA_STREAM_GREETING, self.websocket, self.stream_sid)
+            self.greeting_sent = True
+            logger.info("✅ Initial greeting streamed successfully")
+        except Exception as greeting_error:
+            logger.error(f"❌ Failed to stream initial greeting: {greeting_error}")
+            self.fallback_triggered = True
+    
+    async def on_start(self, start: dict):
+        # Now properly connect to the manager with the real stream_sid
+        manager.active_connections.append(self.websocket)
+        
+        # Add small delay to ensure WebSocket is fully established
+        await asyncio.sleep(0.1)
+        await self.send_greeting()
+    
+    async def on_media(self, chunks: List[bytes]):
+        if not self.stream_sid:
+            return
+        
+        # If we haven't sent greeting yet and we're receiving media, send it now
+        if not self.greeting_sent:
+            logger.info("📨 Sending initial greeting on first media event")
+            await self.send_greeting()
         
-        # Add fallback mechanism - if streaming fails, we can fallback to traditional approach
-        fallback_triggered = False
+        # Initialize audio buffer for this stream if needed
+        buffer = audio_buffers.get(self.stream_sid)
+        if buffer is None:
+            buffer = audio_buffers[self.stream_sid] = AudioBuffer()
         
-        # Track if we've sent the initial greeting
-        greeting_sent = False
+        # Straight into the stream's preallocated ring buffer - no join copy
+        for chunk in chunks:
+            buffer.add_chunk(chunk)
         
-        while True:
-            message = await websocket.receive_text()
-            data = json.loads(message)
-            logger.debug(f"Received Twilio message: {data.get('event', 'unknown')} - {list(data.keys())}")
+        # Check if we should process accumulated audio
+        if buffer.should_process():
+            audio_data = buffer.get_audio_data()
+            logger.debug("Processing audio buffer: %d bytes", len(audio_data))
             
-            if data['event'] == 'connected':
-                logger.info("✅ Media stream connected")
-                
-            elif data['event'] == 'start':
-                stream_sid = data['start']['streamSid']
-                call_sid = data['start']['callSid']
-                logger.info(f"Media stream started: {stream_sid} for call {call_sid}")
-                
-                # Now properly connect to the manager with the real stream_sid
-                manager.active_connections.append(websocket)
-                
-                # Send initial greeting via streaming  
-                greeting_text = "Hey! This is Synthetic Jason speaking in real-time! I can hear you clearly and respond instantly. What's on your mind?"
+            # Simple test response to verify pipeline
+            if len(audio_data) > 1000 and not buffer.last_response_time:
+                logger.info("Audio detected - sending test response")
                 
+                # Stream test response back with error handling (pre-generated at startup)
                 try:
-                    # Add small delay to ensure WebSocket is fully established
-                    await asyncio.sleep(0.1)
-                    await stream_speech_to_twilio(greeting_text, websocket, stream_sid)
-                    logger.info("✅ Initial greeting streamed successfully")
-                except Exception as greeting_error:
-                    logger.error(f"❌ Failed to stream initial greeting: {greeting_error}")
-                    fallback_triggered = True
-                
-            elif data['event'] == 'media':
-                # Extract stream_sid from media event if we don't have it
-                if not stream_sid:
-                    stream_sid = data.get('streamSid')
-                    logger.info(f"🔍 Extracted stream_sid from media event: {stream_sid}")
-                
-                # If we haven't sent greeting yet and we're receiving media, send it now
-                if not greeting_sent and stream_sid:
-                    logger.info("📨 Sending initial greeting on first media event")
-                    greeting_text = "Hey! This is Synthetic Jason speaking in real-time! I can hear you clearly and respond instantly. What's on your mind?"
-                    try:
-                        await stream_speech_to_twilio(greeting_text, websocket, stream_sid)
-                        greeting_sent = True
-                        logger.info("✅ Initial greeting sent successfully")
-                    except Exception as greeting_error:
-                        logger.error(f"❌ Failed to send initial greeting: {greeting_error}")
-                
-                # Receive μ-law audio from Twilio (8kHz, base64)
-                audio_payload = data['media']['payload']
-                audio_chunk = base64.b64decode(audio_payload)
-                
-                # Initialize audio buffer for this stream if needed
-                if stream_sid and stream_sid not in audio_buffers:
-                    audio_buffers[stream_sid] = AudioBuffer()
+                    await stream_speech_to_twilio(MEDIA_STREAM_TEST_RESPONSE, self.websocket, self.stream_sid)
+                    logger.info("✅ Test response streamed successfully")
+                    buffer.last_response_time = time.monotonic()  # Rate limiting
+                except Exception as response_error:
+                    logger.error(f"❌ Failed to stream test response: {response_error}")
+                    self.fallback_triggered = True
                 
-                # Add chunk to buffer
-                buffer = audio_buffers[stream_sid]
-                buffer.add_chunk(audio_chunk)
-                
-                # Check if we should process accumulated audio
-                if buffer.should_process():
-                    audio_data = buffer.get_audio_data()
-                    logger.info(f"Processing audio buffer: {len(audio_data)} bytes")
-                    
-                    # Simple test response to verify pipeline
-                    if len(audio_data) > 1000 and not hasattr(buffer, 'last_response_time'):
-                        logger.info("Audio detected - sending test response")
-                        
-                        # Generate simple test response
-                        test_response = "I heard you! This may sound distorted due to audio format issues."
-                        
-                        # Stream test response back with error handling
-                        try:
-                            await stream_speech_to_twilio(test_response, websocket, stream_sid)
-                            logger.info("✅ Test response streamed successfully")
-                            buffer.last_response_time = time.time()  # Rate limiting
-                        except Exception as response_error:
-                            logger.error(f"❌ Failed to stream test response: {response_error}")
-                            fallback_triggered = True
-                        
-                        # Clear buffer after processing
-                        buffer.clear()
-                    elif hasattr(buffer, 'last_response_time') and (time.time() - buffer.last_response_time) < 10:
-                        # Rate limit responses to every 10 seconds for testing
-                        logger.debug("Skipping response due to rate limiting")
-                        buffer.clear()
-                    else:
-                        logger.info(f"🚨 AUDIO DETECTED: {len(audio_data)} bytes (not responding due to threshold)")
-                        buffer.clear()
-                    
-                    # # For now, respond to any audio activity to test the pipeline
-                    # # But limit responses to prevent overwhelming the WebSocket
-                    # if len(audio_data) > 2000 and not hasattr(buffer, 'last_response_time'):  # More substantial audio + rate limiting
-                    #     logger.info("Audio detected - sending test response")
-                    #     
-                    #     # Generate simple test response
-                    #     test_response = "I heard you! This is a test of real-time audio streaming."
-                    #     
-                    #     # Stream test response back with error handling
-                    #     try:
-                    #         await stream_speech_to_twilio(test_response, websocket, stream_sid)
-                    #         logger.info("✅ Test response streamed successfully")
-                    #         buffer.last_response_time = time.time()  # Rate limiting
-                    #     except Exception as response_error:
-                    #         logger.error(f"❌ Failed to stream test response: {response_error}")
-                    #         fallback_triggered = True
-                    #     
-                    #     # Clear buffer after processing
-                    #     buffer.clear()
-                    # elif hasattr(buffer, 'last_response_time') and (time.time() - buffer.last_response_time) < 5:
-                    #     # Rate limit responses to every 5 seconds
-                    #     logger.debug("Skipping response due to rate limiting")
-                    #     buffer.clear()
-                
-                logger.debug(f"Processed audio chunk: {len(audio_chunk)} bytes, buffer size: {len(buffer.chunks)}")
-                
-            elif data['event'] == 'closed':
-                logger.info(f"Media stream closed: {stream_sid}")
-                break
-                
-    except WebSocketDisconnect:
-        logger.info("Media stream WebSocket disconnected")
-    except Exception as e:
-        logger.error(f"Media stream error: {e}")
-    finally:
-        if stream_sid:
-            manager.disconnect(websocket, stream_sid)
+                # Clear buffer after processing
+                buffer.clear()
+            elif buffer.last_response_time and (time.monotonic() - buffer.last_response_time) < 10:
+                # Rate limit responses to every 10 seconds for testing
+                logger.debug("Skipping response due to rate limiting")
+                buffer.clear()
+            else:
+                logger.debug("Audio detected: %d bytes (not responding due to threshold)", len(audio_data))
+                buffer.clear()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processed %d audio chunks, buffer size: %d bytes", len(chunks), buffer.filled)
+    
+    async def on_closed(self):
+        if self.stream_sid:
+            manager.disconnect(self.websocket, self.stream_sid)
             # Clean up audio buffer
-            if stream_sid in audio_buffers:
-                del audio_buffers[stream_sid]
+            audio_buffers.pop(self.stream_sid, None)
 
-@app.websocket("/coqui-stream")
-async def handle_coqui_stream(websocket: WebSocket):
-    """Handle Twilio Media Streams for Coqui TTS system"""
-    stream_sid = None
-    call_sid = None
+class CoquiMediaSession(MediaSession):
+    """
+    Media stream answered with local models: Whisper for ASR, Simple/Coqui TTS.
     
-    # Import Coqui components (lazy loading)
-    try:
-        from simple_tts import generate_simple_speech, initialize_simple_tts
-        logger.info("✅ Simple TTS fallback loaded successfully")
-        TTS_TYPE = "simple"
-        generate_speech = generate_simple_speech
-        initialize_tts = initialize_simple_tts
-    except Exception as e:
-        logger.error(f"❌ Failed to load Simple TTS fallback: {e}")
-        await websocket.close()
-        return
+    ASR → LLM → TTS run as concurrent stages connected by queues, so incoming
+    frames keep being read (and transcribed) while an earlier utterance is
+    still being answered or synthesized.
+    """
+    name = "Coqui Media stream"
     
-    # Keep original Coqui import for future use
-    try:
-        from coqui_tts import generate_coqui_speech, initialize_coqui_tts
-        from whisper_transcription import (
-            add_audio_for_transcription, 
-            get_transcription, 
-            cleanup_transcription_stream,
-            initialize_whisper
-        )
-        from audio_utils import convert_wav_for_twilio, convert_twilio_to_wav, AudioConverter
-        
-        # Initialize systems on first connection
-        logger.info(f"🔧 Initializing {TTS_TYPE.upper()} TTS system...")
-        tts_ready = await initialize_tts()
+    def __init__(self, websocket: WebSocket):
+        super().__init__(websocket)
+        self.asr_queue: asyncio.Queue = asyncio.Queue(maxsize=ASR_QUEUE_MAX_BATCHES)
+        self.llm_queue: asyncio.Queue = asyncio.Queue()
+        self.tts_queue: asyncio.Queue = asyncio.Queue()
+        self.pipeline_tasks = []
+        self.dropped_batches = 0
+        self.last_overflow_log = 0.0
+    
+    async def prepare(self) -> bool:
+        # Import Coqui components (lazy loading)
         try:
-            whisper_ready = await initialize_whisper("base")
-        except:
-            logger.warning("⚠️ Whisper initialization failed, continuing without transcription")
-            whisper_ready = True
+            from simple_tts import generate_simple_speech
+            logger.info("✅ Simple TTS fallback loaded successfully")
+            self.tts_type = "simple"
+            self.generate_speech = generate_simple_speech
+        except Exception as e:
+            logger.error(f"❌ Failed to load Simple TTS fallback: {e}")
+            await self.websocket.close()
+            return False
         
-        if not tts_ready or not whisper_ready:
+        # Already loaded at startup when USE_COQUI_TEST is on; otherwise the first call loads them
+        if not await ensure_coqui_models():
             logger.error("❌ Failed to initialize Coqui systems - falling back to ElevenLabs")
             # Could redirect to ElevenLabs system here
-            return
-            
-    except ImportError as e:
-        logger.error(f"❌ Coqui dependencies not available: {e}")
-        logger.error("Install with: pip install TTS faster-whisper torch numpy")
-        return
-    
-    try:
-        await websocket.accept()
-        logger.info("🧪 Coqui Media stream WebSocket accepted")
+            return False
+        
+        # Keep original Coqui import for future use
+        try:
+            from coqui_tts import generate_coqui_speech, initialize_coqui_tts
+            from whisper_transcription import (
+                add_audio_for_transcription,
+                get_transcription,
+                cleanup_transcription_stream
+            )
+            from audio_utils import AudioConverter
+        except ImportError as e:
+            logger.error(f"❌ Coqui dependencies not available: {e}")
+            logger.error("Install with: pip install TTS faster-whisper torch numpy")
+            return False
         
+        self.add_audio_for_transcription = add_audio_for_transcription
+        self.get_transcription = get_transcription
+        self.cleanup_transcription_stream = cleanup_transcription_stream
+        self.converter = AudioConverter
+        return True
+    
+    async def asr_worker(self):
         while True:
-            message = await websocket.receive_text()
-            data = json.loads(message)
-            logger.debug(f"Coqui stream received: {data.get('event', 'unknown')}")
-            
-            if data['event'] == 'connected':
-                logger.info("✅ Coqui Media stream connected")
-                
-            elif data['event'] == 'start':
-                stream_sid = data['start']['streamSid']
-                call_sid = data['start']['callSid']
-                logger.info(f"🚀 Coqui Media stream started: {stream_sid} for call {call_sid}")
-                
-                # Send initial greeting via Coqui TTS
-                greeting_text = f"Hey! This is Synthetic Jason using {TTS_TYPE} TTS. Testing the new voice streaming system... How does this sound?"
-                
-                try:
-                    # Generate speech with Coqui TTS
-                    audio_wav = await generate_speech(greeting_text)
-                    if audio_wav:
-                        # Convert to Twilio format and send
-                        audio_b64 = convert_wav_for_twilio(audio_wav)
-                        if audio_b64:
-                            media_message = {
-                                "event": "media",
-                                "streamSid": stream_sid,
-                                "media": {"payload": audio_b64}
-                            }
-                            await websocket.send_text(json.dumps(media_message))
-                            logger.info("✅ Coqui greeting sent successfully")
-                        else:
-                            logger.error("❌ Failed to convert Coqui audio for Twilio")
-                    else:
-                        logger.error("❌ Coqui TTS failed to generate greeting")
-                except Exception as tts_error:
-                    logger.error(f"❌ Coqui TTS error: {tts_error}")
-                
-            elif data['event'] == 'media':
-                # Extract stream_sid from media event if we don't have it
-                if not stream_sid:
-                    stream_sid = data.get('streamSid')
-                    logger.info(f"🔍 Extracted stream_sid: {stream_sid}")
-                
-                # Receive μ-law audio from Twilio (8kHz, base64)
-                audio_payload = data['media']['payload']
-                mulaw_data = base64.b64decode(audio_payload)
-                
-                # Convert to PCM for Whisper
-                pcm_data = AudioConverter.mulaw_to_pcm(mulaw_data)
-                if pcm_data:
-                    # Add to transcription buffer
-                    add_audio_for_transcription(stream_sid, pcm_data, 8000)
-                    
-                    # Check for transcription
-                    transcription = await get_transcription(stream_sid, 8000)
-                    if transcription:
-                        logger.info(f"🎤 Transcribed: '{transcription}'")
-                        
-                        # Generate AI response (reuse existing logic)
-                        ai_response = await get_ai_response(transcription)
-                        
-                        # Generate speech with Coqui TTS
-                        try:
-                            audio_wav = await generate_speech(ai_response)
-                            if audio_wav:
-                                audio_b64 = convert_wav_for_twilio(audio_wav)
-                                if audio_b64:
-                                    media_message = {
-                                        "event": "media",
-                                        "streamSid": stream_sid,
-                                        "media": {"payload": audio_b64}
-                                    }
-                                    await websocket.send_text(json.dumps(media_message))
-                                    logger.info(f"✅ Coqui response sent: '{ai_response[:50]}...'")
-                        except Exception as response_error:
-                            logger.error(f"❌ Failed to generate Coqui response: {response_error}")
-                
-                logger.debug(f"Processed Coqui audio chunk: {len(mulaw_data)} μ-law bytes")
-                
-            elif data['event'] == 'closed':
-                logger.info(f"Coqui Media stream closed: {stream_sid}")
-                break
+            pcm_data = await self.asr_queue.get()
+            try:
+                # Feed everything that queued up while we were busy, then check once
+                self.add_audio_for_transcription(self.stream_sid, pcm_data, 8000)
+                while not self.asr_queue.empty():
+                    self.add_audio_for_transcription(self.stream_sid, self.asr_queue.get_nowait(), 8000)
                 
-    except WebSocketDisconnect:
-        logger.info("Coqui Media stream WebSocket disconnected")
-    except Exception as e:
-        logger.error(f"Coqui Media stream error: {e}")
-        import traceback
-        logger.error(f"Full traceback: {traceback.format_exc()}")
-    finally:
-        if stream_sid:
-            cleanup_transcription_stream(stream_sid)
-            logger.info(f"Coqui stream cleanup completed for {stream_sid}")
+                transcription = await self.get_transcription(self.stream_sid, 8000)
+                if transcription:
+                    logger.info(f"🎤 Transcribed: '{transcription}'")
+                    self.llm_queue.put_nowait(transcription)
+            except Exception as asr_error:
+                logger.error(f"❌ Coqui transcription failed: {asr_error}")
+    
+    async def llm_worker(self):
+        while True:
+            transcription = await self.llm_queue.get()
+            # Generate AI response (reuse existing logic)
+            ai_response = await get_ai_response(transcription)
+            self.tts_queue.put_nowait(ai_response)
+    
+    async def speech_payloads(self, text: str) -> AsyncIterator[str]:
+        """Yield 20ms µ-law payloads sentence by sentence instead of after the whole utterance"""
+        sentences = split_sentences(text)
+        if not sentences:
+            return
+        # Synthesize the next sentence while the current one is being sent
+        pending = asyncio.create_task(self.generate_speech(sentences[0]))
+        try:
+            for i in range(len(sentences)):
+                audio_wav = await pending
+                if i + 1 < len(sentences):
+                    pending = asyncio.create_task(self.generate_speech(sentences[i + 1]))
+                if not audio_wav:
+                    logger.error(f"❌ TTS failed for sentence: '{sentences[i][:50]}...'")
+                    continue
+                mulaw_data = self.converter.wav_to_twilio_mulaw(audio_wav)
+                for offset in range(0, len(mulaw_data), AudioBuffer.FRAME_BYTES):
+                    yield self.converter.mulaw_to_base64(mulaw_data[offset:offset + AudioBuffer.FRAME_BYTES])
+        finally:
+            pending.cancel()
+    
+    async def tts_worker(self):
+        while True:
+            ai_response = await self.tts_queue.get()
+            # Generate speech with Coqui TTS
+            try:
+                pacer = FramePacer()
+                async with contextlib.aclosing(self.speech_payloads(ai_response)) as payloads:
+                    async for payload in payloads:
+                        if not await send_media_payload(self.websocket, self.stream_sid, payload, pacer):
+                            break
+                logger.info(f"✅ Coqui response sent: '{ai_response[:50]}...'")
+            except Exception as response_error:
+                logger.error(f"❌ Failed to generate Coqui response: {response_error}")
+    
+    async def on_accept(self):
+        self.pipeline_tasks = [
+            asyncio.create_task(self.asr_worker()),
+            asyncio.create_task(self.llm_worker()),
+            asyncio.create_task(self.tts_worker()),
+        ]
+    
+    async def on_start(self, start: dict):
+        # Send initial greeting via Coqui TTS
+        greeting_text = f"Hey! This is Synthetic Jason using {self.tts_type} TTS. Testing the new voice streaming system... How does this sound?"
+        
+        try:
+            # The greeting never changes, so only the first call pays for TTS
+            if await send_cached_frames(self.websocket, self.stream_sid, greeting_text, voice=self.tts_type):
+                logger.info("✅ Coqui greeting replayed from cache")
+            else:
+                # Generate speech with Coqui TTS, sending frames as they're produced
+                greeting_payloads = []
+                pacer = FramePacer()
+                async with contextlib.aclosing(self.speech_payloads(greeting_text)) as payloads:
+                    async for payload in payloads:
+                        greeting_payloads.append(payload)
+                        await send_media_payload(self.websocket, self.stream_sid, payload, pacer)
+                if greeting_payloads:
+                    cache_frames(greeting_text, greeting_payloads, voice=self.tts_type)
+                    logger.info("✅ Coqui greeting sent successfully")
+                else:
+                    logger.error("❌ Coqui TTS failed to generate greeting")
+        except Exception as tts_error:
+            logger.error(f"❌ Coqui TTS error: {tts_error}")
+    
+    async def on_media(self, chunks: List[bytes]):
+        # One conversion for the whole batch, then hand off to the transcription stage
+        mulaw_data = b''.join(chunks)
+        pcm_data = self.converter.mulaw_to_pcm(mulaw_data)
+        if pcm_data:
+            try:
+                self.asr_queue.put_nowait(pcm_data)
+            except asyncio.QueueFull:
+                # Transcription is behind: drop the newest audio rather than queue without bound
+                self.dropped_batches += 1
+                now = time.monotonic()
+                if now - self.last_overflow_log >= OVERFLOW_LOG_INTERVAL:
+                    logger.warning(f"Coqui transcription queue full - dropped {self.dropped_batches} audio batches")
+                    self.dropped_batches = 0
+                    self.last_overflow_log = now
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processed %d Coqui audio chunks: %d μ-law bytes", len(chunks), len(mulaw_data))
+    
+    async def on_closed(self):
+        for task in self.pipeline_tasks:
+            task.cancel()
+        if self.stream_sid:
+            self.cleanup_transcription_stream(self.stream_sid)
+            logger.info(f"Coqui stream cleanup completed for {self.stream_sid}")
+
+@app.websocket("/media-stream")
+async def handle_media_stream(websocket: WebSocket):
+    """Handle Twilio Media Streams for real-time bidirectional audio"""
+    await ElevenLabsMediaSession(websocket).run()
+
+@app.websocket("/coqui-stream")
+async def handle_coqui_stream(websocket: WebSocket):
+    """Handle Twilio Media Streams for Coqui TTS system"""
+    await CoquiMediaSession(websocket).run()
 
 
 # ===== STREAMING DEBUG TEST SYSTEM =====
 # Non-destructive testing system for debugging streaming audio
 # Runs alongside production system without affecting it
 
+@functools.lru_cache(maxsize=1)
+def find_ffmpeg() -> Optional[str]:
+    """Path to ffmpeg, or None if it isn't installed. Looked up once per process."""
+    for ffmpeg_path in ('/usr/local/bin/ffmpeg', '/opt/homebrew/bin/ffmpeg'):
+        if os.path.exists(ffmpeg_path):
+            return ffmpeg_path
+    return shutil.which('ffmpeg')
+
 @app.get("/test-streaming-status")
 async def test_streaming_status():
     """Check if streaming test dependencies are available"""
@@ -1352,12 +2743,7 @@ async def test_streaming_status():
     except ImportError:
         simple_tts_available = False
     
-    import subprocess
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-        ffmpeg_available = True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        ffmpeg_available = False
+    ffmpeg_available = find_ffmpeg() is not None
     
     return {
         "status": "ready" if simple_tts_available and ffmpeg_available else "missing_deps",
@@ -1378,8 +2764,7 @@ async def test_audio_conversion():
     """Test 1: Coqui → WAV → Mulaw conversion pipeline"""
     try:
         from simple_tts import initialize_simple_tts, generate_simple_speech
-        import subprocess
-        import os
+        from audio_utils import AudioConverter
         
         test_text = "Testing streaming voice Jason - this should be crystal clear"
         logger.info(f"🧪 Test 1: Converting text '{test_text}'")
@@ -1399,38 +2784,16 @@ async def test_audio_conversion():
         with open(wav_path, 'wb') as f:
             f.write(wav_data)
         
-        # 2. Try to convert to Twilio mulaw format (skip if FFmpeg not available)
+        # 2. Convert to Twilio mulaw format in-process (same path the media stream uses)
         mulaw_path = "/tmp/streaming_test.ulaw"
-        mulaw_size = 0
-        format_info = "ffmpeg_not_available"
-        
-        # Check if ffmpeg exists
-        ffmpeg_available = False
-        for ffmpeg_path in ['/usr/local/bin/ffmpeg', '/opt/homebrew/bin/ffmpeg', 'ffmpeg']:
-            try:
-                result = subprocess.run([ffmpeg_path, '-version'], capture_output=True, timeout=2)
-                if result.returncode == 0:
-                    ffmpeg_available = True
-                    # Try conversion
-                    result = subprocess.run([
-                        ffmpeg_path, '-y', '-i', wav_path,
-                        '-ar', '8000', '-ac', '1', '-f', 'mulaw', mulaw_path
-                    ], capture_output=True, text=True)
-                    
-                    if result.returncode == 0:
-                        mulaw_size = os.path.getsize(mulaw_path)
-                        # Probe final format
-                        probe_result = subprocess.run([
-                            'ffprobe', '-v', 'quiet', '-show_entries', 
-                            'stream=codec_name,sample_rate,channels',
-                            '-of', 'csv=p=0', mulaw_path
-                        ], capture_output=True, text=True)
-                        format_info = probe_result.stdout.strip() if probe_result.returncode == 0 else "unknown"
-                    else:
-                        format_info = f"conversion_failed: {result.stderr}"
-                    break
-            except:
-                continue
+        mulaw_data = AudioConverter.wav_to_twilio_mulaw(wav_data)
+        mulaw_size = len(mulaw_data)
+        if mulaw_size:
+            with open(mulaw_path, 'wb') as f:
+                f.write(mulaw_data)
+            format_info = f"pcm_mulaw,{AudioConverter.TWILIO_SAMPLE_RATE},{AudioConverter.TWILIO_CHANNELS}"
+        else:
+            format_info = "conversion_failed"
         
         # 3. Analyze results
         wav_size = len(wav_data)
@@ -1441,7 +2804,6 @@ async def test_audio_conversion():
             "input_wav_bytes": wav_size,
             "output_mulaw_bytes": mulaw_size,
             "final_format": format_info,
-            "ffmpeg_available": ffmpeg_available,
             "files": {
                 "wav": wav_path
             },
@@ -1450,13 +2812,12 @@ async def test_audio_conversion():
             }
         }
         
-        if ffmpeg_available and mulaw_size > 0:
+        if mulaw_size > 0:
             result["compression_ratio"] = f"{mulaw_size/wav_size:.2f}" if wav_size > 0 else "N/A"
             result["files"]["mulaw"] = mulaw_path
             result["test_commands"]["play_mulaw"] = f"ffplay -f mulaw -ar 8000 -ac 1 {mulaw_path}"
         else:
             result["compression_ratio"] = "N/A (no conversion)"
-            result["note"] = "Install ffmpeg to test mulaw conversion: brew install ffmpeg"
         
         return result
         
@@ -1464,32 +2825,48 @@ async def test_audio_conversion():
         logger.error(f"Audio conversion test failed: {e}")
         return {"error": str(e)}
 
+# Top of each G.711 μ-law segment, on the biased 14-bit magnitude scale
+_MULAW_SEGMENT_ENDS = (0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF)
+
+@functools.lru_cache(maxsize=1)
+def pcm16_to_mulaw_table():
+    """
+    μ-law byte for every 16-bit sample, indexed by the sample's bit pattern read
+    as uint16 (same values as audioop.lin2ulaw). Built on first use: only the
+    debug audio paths need it, and they're the only ones that import numpy.
+    """
+    import numpy as np
+    
+    pcm = np.arange(0x10000, dtype=np.int32)
+    pcm = np.where(pcm & 0x8000, pcm - 0x10000, pcm) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), 8159) + (0x84 >> 2)
+    segment = np.searchsorted(_MULAW_SEGMENT_ENDS, magnitude)
+    code = (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+    return (np.where(segment < 8, code, 0x7F) ^ mask).astype(np.uint8)
+
+@functools.lru_cache(maxsize=1)
+def sine_wave_mulaw(frequency: int = 440, seconds: int = 2, sample_rate: int = 8000) -> tuple:
+    """Known-good test tone as (μ-law bytes, base64 payload, base64 20ms frames), built once"""
+    import numpy as np
+    
+    t = np.arange(seconds * sample_rate) / sample_rate
+    samples = (16000 * np.sin(2 * np.pi * frequency * t)).astype('<i2')
+    mulaw_data = pcm16_to_mulaw_table()[samples.view('<u2')].tobytes()
+    return mulaw_data, base64.b64encode(mulaw_data).decode('ascii'), mulaw_frames(mulaw_data)
+
 @app.post("/test-sine-wave")
 async def test_sine_wave():
     """Test 3: Generate known-good mulaw audio for WebSocket testing"""
     try:
-        import subprocess
-        import base64
-        import os
+        # Synthesized in-process once instead of running ffmpeg on every request
+        mulaw_data, payload, _ = sine_wave_mulaw()
+        file_size = len(mulaw_data)
         
-        # Generate sine wave directly in mulaw format
+        # Still written out so it can be played back / analyzed by hand
         sine_path = "/tmp/test_sine.ulaw"
-        result = subprocess.run([
-            'ffmpeg', '-y',
-            '-f', 'lavfi', 
-            '-i', 'sine=frequency=440:duration=2:sample_rate=8000',
-            '-f', 'mulaw', sine_path
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            return {"error": f"Sine wave generation failed: {result.stderr}"}
-        
-        # Read and encode for WebSocket
-        with open(sine_path, 'rb') as f:
-            mulaw_data = f.read()
-        
-        payload = base64.b64encode(mulaw_data).decode('ascii')
-        file_size = len(mulaw_data)
+        with open(sine_path, 'wb') as f:
+            f.write(mulaw_data)
         
         return {
             "status": "success", 
@@ -1518,8 +2895,9 @@ async def test_coqui_analysis():
     """Test 4: Analyze Simple TTS output format in detail"""
     try:
         from simple_tts import initialize_simple_tts, generate_simple_speech
-        import subprocess
+        import io
         import time
+        import wave
         
         # Initialize TTS first
         tts_ready = await initialize_simple_tts()
@@ -1550,12 +2928,6 @@ async def test_coqui_analysis():
             with open(wav_path, 'wb') as f:
                 f.write(wav_data)
             
-            # Detailed analysis with ffprobe
-            probe_result = subprocess.run([
-                'ffprobe', '-v', 'quiet', '-print_format', 'json',
-                '-show_streams', '-show_format', wav_path
-            ], capture_output=True, text=True)
-            
             analysis = {
                 "phrase": phrase,
                 "phrase_length": len(phrase),
@@ -1565,18 +2937,21 @@ async def test_coqui_analysis():
                 "file": wav_path
             }
             
-            if probe_result.returncode == 0:
-                import json
-                probe_data = json.loads(probe_result.stdout)
-                if 'streams' in probe_data and probe_data['streams']:
-                    stream = probe_data['streams'][0]
+            # Read the format from the WAV header instead of shelling out to ffprobe
+            try:
+                with wave.open(io.BytesIO(wav_data), 'rb') as wav_file:
+                    sample_rate = wav_file.getframerate()
+                    channels = wav_file.getnchannels()
+                    sampwidth = wav_file.getsampwidth()
                     analysis.update({
-                        "sample_rate": stream.get('sample_rate', 'unknown'),
-                        "channels": stream.get('channels', 'unknown'),
-                        "codec": stream.get('codec_name', 'unknown'),
-                        "bit_rate": stream.get('bit_rate', 'unknown'),
-                        "duration": stream.get('duration', 'unknown')
+                        "sample_rate": str(sample_rate),
+                        "channels": channels,
+                        "codec": f"pcm_s{sampwidth * 8}le" if sampwidth > 1 else "pcm_u8",
+                        "bit_rate": str(sample_rate * channels * sampwidth * 8),
+                        "duration": f"{wav_file.getnframes() / sample_rate:.6f}" if sample_rate else 'unknown'
                     })
+            except (wave.Error, EOFError):
+                pass
             
             results.append(analysis)
         
@@ -1594,394 +2969,412 @@ async def test_coqui_analysis():
         logger.error(f"Coqui analysis test failed: {e}")
         return {"error": str(e)}
 
-@app.websocket("/test-websocket-debug")
-async def test_websocket_debug(websocket: WebSocket):
-    """Debug WebSocket for Twilio Media Streams - Fixed for Railway"""
-    import os
+async def _debug_on_test_sine_wave(websocket: WebSocket, data: dict):
+    """Send back the precomputed sine wave as debug frames"""
+    # Send back the precomputed sine wave
     try:
-        await websocket.accept()
-        logger.info("WebSocket connected to Twilio Media Stream")
-        
-        # Don't send initial message - wait for Twilio events
-        # Twilio will send: connected, start, media, closed
-        
+        mulaw_data, _, frames = sine_wave_mulaw()
+        pacer = FramePacer()
         chunk_count = 0
         
-        while True:
-            message = await websocket.receive_text()
-            data = json.loads(message)
+        # Send in chunks like Twilio would (20ms of audio at 8kHz each)
+        for payload in frames:
+            response = {
+                "event": "debug_audio_chunk",
+                "chunk_number": chunk_count,
+                "payload_size": len(payload),
+                "audio_bytes": AudioBuffer.FRAME_BYTES,
+                "payload": payload
+            }
+            await websocket.send_text(_dumps(response))
+            chunk_count += 1
+            await pacer.wait()
+        
+        await websocket.send_text(_dumps({
+            "event": "debug_audio_complete",
+            "total_chunks": chunk_count,
+            "total_bytes": len(mulaw_data)
+        }))
             
-            event = data.get('event', 'unknown')
-            logger.debug(f"WebSocket event: {event}")
+    except Exception as e:
+        await websocket.send_text(_dumps({
+            "event": "debug_error", 
+            "message": f"Failed to send sine wave: {e}"
+        }))
+
+async def _debug_on_test_coqui_audio(websocket: WebSocket, data: dict):
+    """Synthesize text with Simple TTS and send it back as one µ-law payload"""
+    # Test with Coqui generated audio
+    text = data.get('text', 'Debug test message')
+    try:
+        from simple_tts import generate_simple_speech
+        
+        # Generate and convert
+        wav_data = await generate_simple_speech(text)
+        ffmpeg_path = find_ffmpeg()
+        if not ffmpeg_path:
+            await websocket.send_text(_dumps({
+                "event": "debug_error",
+                "message": "ffmpeg not available for conversion"
+            }))
+        elif wav_data:
+            wav_path = "/tmp/debug_coqui.wav"
+            mulaw_path = "/tmp/debug_coqui.ulaw"
             
-            if event == 'test_sine_wave':
-                # Send back the sine wave we generated earlier
-                try:
-                    sine_path = "/tmp/test_sine.ulaw"
-                    if os.path.exists(sine_path):
-                        with open(sine_path, 'rb') as f:
-                            mulaw_data = f.read()
-                        
-                        # Send in chunks like Twilio would
-                        chunk_size = 160  # 20ms of audio at 8kHz
-                        chunks = [mulaw_data[i:i+chunk_size] for i in range(0, len(mulaw_data), chunk_size)]
-                        
-                        for chunk in chunks:
-                            payload = base64.b64encode(chunk).decode('ascii')
-                            response = {
-                                "event": "debug_audio_chunk",
-                                "chunk_number": chunk_count,
-                                "payload_size": len(payload),
-                                "audio_bytes": len(chunk),
-                                "payload": payload
-                            }
-                            await websocket.send_text(json.dumps(response))
-                            chunk_count += 1
-                            await asyncio.sleep(0.01)  # 10ms delay for faster streaming (was 20ms)
-                        
-                        await websocket.send_text(json.dumps({
-                            "event": "debug_audio_complete",
-                            "total_chunks": chunk_count,
-                            "total_bytes": len(mulaw_data)
-                        }))
-                    else:
-                        await websocket.send_text(json.dumps({
-                            "event": "debug_error",
-                            "message": "No sine wave file found - run /test-sine-wave first"
-                        }))
-                        
-                except Exception as e:
-                    await websocket.send_text(json.dumps({
-                        "event": "debug_error", 
-                        "message": f"Failed to send sine wave: {e}"
-                    }))
+            with open(wav_path, 'wb') as f:
+                f.write(wav_data)
             
-            elif event == 'test_coqui_audio':
-                # Test with Coqui generated audio
-                text = data.get('text', 'Debug test message')
-                try:
-                    from simple_tts import generate_simple_speech
-                    import subprocess
-                    
-                    # Generate and convert
-                    wav_data = await generate_simple_speech(text)
-                    if wav_data:
-                        wav_path = "/tmp/debug_coqui.wav"
-                        mulaw_path = "/tmp/debug_coqui.ulaw"
-                        
-                        with open(wav_path, 'wb') as f:
-                            f.write(wav_data)
-                        
-                        result = subprocess.run([
-                            'ffmpeg', '-y', '-i', wav_path,
-                            '-ar', '8000', '-ac', '1', '-f', 'mulaw', mulaw_path
-                        ], capture_output=True)
-                        
-                        if result.returncode == 0:
-                            with open(mulaw_path, 'rb') as f:
-                                mulaw_data = f.read()
-                            
-                            payload = base64.b64encode(mulaw_data).decode('ascii')
-                            await websocket.send_text(json.dumps({
-                                "event": "debug_coqui_audio",
-                                "text": text,
-                                "wav_bytes": len(wav_data),
-                                "mulaw_bytes": len(mulaw_data),
-                                "payload": payload
-                            }))
-                        else:
-                            await websocket.send_text(json.dumps({
-                                "event": "debug_error",
-                                "message": f"Conversion failed: {result.stderr.decode()}"
-                            }))
-                    else:
-                        await websocket.send_text(json.dumps({
-                            "event": "debug_error",
-                            "message": "Coqui generation failed"
-                        }))
-                        
-                except Exception as e:
-                    await websocket.send_text(json.dumps({
-                        "event": "debug_error",
-                        "message": f"Coqui test failed: {e}"
-                    }))
+            # Async subprocess so other streams keep running during conversion
+            result = await asyncio.create_subprocess_exec(
+                ffmpeg_path, '-y', '-i', wav_path,
+                '-ar', '8000', '-ac', '1', '-f', 'mulaw', mulaw_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            _, stderr = await result.communicate()
             
-            elif event == 'connected':
-                logger.info("✅ Debug: Twilio Media Stream connected")
+            if result.returncode == 0:
+                with open(mulaw_path, 'rb') as f:
+                    mulaw_data = f.read()
                 
-            elif event == 'start':
-                stream_sid = data['start']['streamSid']
-                call_sid = data['start']['callSid']
-
-                # Get caller phone number from custom parameters
-                custom_params = data['start'].get('customParameters', {})
-                phone_number = custom_params.get('phoneNumber', 'unknown')
-
-                logger.info(f"WebSocket stream started - Stream: {stream_sid}, Call: {call_sid}, From: {phone_number}")
-
-                # Store stream info for later use
-                websocket.stream_sid = stream_sid
-                websocket.call_sid = call_sid
-                websocket.phone_number = phone_number
-                websocket.audio_chunk_count = 0
-                websocket.last_response_time = 0
-                websocket.greeting_complete = False
-                websocket.is_playing_tts = False  # Initialize to prevent race conditions
+                payload = base64.b64encode(mulaw_data).decode('ascii')
+                await websocket.send_text(_dumps({
+                    "event": "debug_coqui_audio",
+                    "text": text,
+                    "wav_bytes": len(wav_data),
+                    "mulaw_bytes": len(mulaw_data),
+                    "payload": payload
+                }))
+            else:
+                await websocket.send_text(_dumps({
+                    "event": "debug_error",
+                    "message": f"Conversion failed: {stderr.decode()}"
+                }))
+        else:
+            await websocket.send_text(_dumps({
+                "event": "debug_error",
+                "message": "Coqui generation failed"
+            }))
+            
+    except Exception as e:
+        await websocket.send_text(_dumps({
+            "event": "debug_error",
+            "message": f"Coqui test failed: {e}"
+        }))
 
-                # Generate personalized greeting based on caller history
-                from caller_memory import generate_greeting
-                greeting_message = generate_greeting(phone_number)
-                is_returning = 'back' in greeting_message.lower() or 'again' in greeting_message.lower()
-                logger.info(f"🔊 Sending {'returning caller' if is_returning else 'first-time'} greeting")
+async def _debug_on_connected(websocket: WebSocket, data: dict):
+    logger.info("✅ Debug: Twilio Media Stream connected")
+
+async def _debug_on_start(websocket: WebSocket, data: dict):
+    """Remember the caller and play their personalized greeting"""
+    stream_sid = data['start']['streamSid']
+    call_sid = data['start']['callSid']
+
+    # Get caller phone number from custom parameters
+    custom_params = data['start'].get('customParameters', {})
+    phone_number = custom_params.get('phoneNumber', 'unknown')
+
+    logger.info(f"WebSocket stream started - Stream: {stream_sid}, Call: {call_sid}, From: {phone_number}")
+
+    # Store stream info for later use
+    websocket.stream_sid = stream_sid
+    websocket.call_sid = call_sid
+    websocket.phone_number = phone_number
+    websocket.audio_chunk_count = 0
+    websocket.last_response_time = 0
+    websocket.greeting_complete = False
+    websocket.is_playing_tts = False  # Initialize to prevent race conditions
+    # The rest of _debug_on_media's state: its own init block is skipped once
+    # audio_chunk_count exists
+    websocket.last_audio_time = time.time()
+    websocket.silence_task = None
+    websocket.audio_buffer = []  # Buffer for STT
+
+    # Generate personalized greeting based on caller history
+    from caller_memory import generate_greeting
+    greeting_message = generate_greeting(phone_number)
+    is_returning = 'back' in greeting_message.lower() or 'again' in greeting_message.lower()
+    logger.info(f"🔊 Sending {'returning caller' if is_returning else 'first-time'} greeting")
 
-                try:
-                    # Mark that we're playing TTS (blocks silence detection)
-                    websocket.is_playing_tts = True
+    try:
+        # Mark that we're playing TTS (blocks silence detection)
+        websocket.is_playing_tts = True
 
-                    try:
-                        # Use the production-ready stream_speech_to_twilio function
-                        # This handles ElevenLabs WebSocket + MP3 to µ-law conversion
-                        await stream_speech_to_twilio(greeting_message, websocket, stream_sid)
-                        logger.info("✅ Sent greeting to caller via ElevenLabs streaming")
+        try:
+            # Use the production-ready stream_speech_to_twilio function
+            # ElevenLabs WebSocket streams µ-law directly (no conversion)
+            await stream_speech_to_twilio(greeting_message, websocket, stream_sid)
+            logger.info("✅ Sent greeting to caller via ElevenLabs streaming")
 
-                        # Mark greeting as complete and update timing
-                        websocket.greeting_complete = True
-                        websocket.last_response_time = time.time()
-                        logger.info(f"✅ Greeting complete - ready for user input")
+            # Mark greeting as complete and update timing
+            websocket.greeting_complete = True
+            websocket.last_response_time = time.time()
+            logger.info(f"✅ Greeting complete - ready for user input")
 
-                    finally:
-                        # ALWAYS reset flag, even if TTS fails
-                        websocket.is_playing_tts = False
+        finally:
+            # ALWAYS reset flag, even if TTS fails
+            websocket.is_playing_tts = False
 
-                except Exception as e:
-                    logger.error(f"ElevenLabs streaming error: {e}")
-                    import traceback
-                    logger.debug(f"Traceback: {traceback.format_exc()}")
-            
-            elif event == 'media':
-                # Handle incoming audio from caller
-                stream_sid = data.get('streamSid', getattr(websocket, 'stream_sid', 'unknown'))
-                audio_payload = data['media']['payload']
-                audio_chunk = base64.b64decode(audio_payload)
-                
-                # Initialize counters and audio buffer if not present
-                if not hasattr(websocket, 'audio_chunk_count'):
-                    websocket.audio_chunk_count = 0
-                    websocket.last_audio_time = time.time()
-                    websocket.last_response_time = time.time()  # Set to now so greeting doesn't trigger silence detection
-                    websocket.silence_task = None
-                    websocket.greeting_complete = False
-                    websocket.audio_buffer = []  # Buffer for STT
-
-                websocket.audio_chunk_count += 1
-
-                # Detect if audio chunk contains actual speech (amplitude-based)
-                # µ-law audio: silent chunks have values near 127 (neutral), speech has variation
-                import audioop
-                rms = audioop.rms(audio_chunk, 1)  # Root mean square for µ-law (1 byte per sample)
-                # Threshold: Background noise is ~30-60 RMS, actual speech is 100+ RMS
-                is_speech = rms > 70  # Lowered for faster speech detection (was 80)
-
-                # Log RMS values to calibrate threshold
-                if websocket.audio_chunk_count % 100 == 0:
-                    logger.info(f"🔊 Audio RMS: {rms}, is_speech: {is_speech}")
-
-                if is_speech:
-                    websocket.last_audio_time = time.time()
-
-                # Buffer audio chunks for transcription
-                if not hasattr(websocket, 'audio_buffer'):
-                    websocket.audio_buffer = []
-                websocket.audio_buffer.append(audio_chunk)
-
-                # Mark greeting as complete after receiving substantial audio (user is speaking)
-                if websocket.audio_chunk_count > 100 and not getattr(websocket, 'greeting_complete', False):
-                    websocket.greeting_complete = True
-                    logger.info("👤 User started speaking, enabling silence detection")
-
-                # Log every 100 chunks so we know audio is coming in
-                if websocket.audio_chunk_count % 100 == 0:
-                    logger.info(f"📥 Received {websocket.audio_chunk_count} audio chunks ({len(audio_chunk)} bytes each)")
-
-                # Only use silence detection AFTER user has started speaking (greeting is done)
-                if getattr(websocket, 'greeting_complete', False):
-                    # Simple silence detection: Respond after 3 seconds of silence
-                    # Only create task if there isn't one already running
-                    silence_task = getattr(websocket, 'silence_task', None)
-
-                    # If speech detected, cancel any pending silence task
-                    if is_speech and silence_task and not silence_task.done():
-                        silence_task.cancel()
-                        websocket.silence_task = None
-
-                    # If no speech and no task running, create new silence detection task
-                    if not is_speech and (silence_task is None or silence_task.done()):
-                        # Create new silence detection task
-                        async def check_silence():
-                            await asyncio.sleep(1.5)  # Reduced for faster response (was 2.0s)
-                            # Check if still silent
-                            last_audio = getattr(websocket, 'last_audio_time', time.time())
-                            time_since_speech = time.time() - last_audio
-                            logger.info(f"⏱️ Checking silence: {time_since_speech:.1f}s since last speech")
-                            if time_since_speech >= 1.4:  # Reduced from 1.9s
-                                # User stopped talking, transcribe and respond
-                                current_time = time.time()
-
-                                # Skip if greeting hasn't completed yet
-                                if not getattr(websocket, 'greeting_complete', False):
-                                    logger.info("⏸️  Skipping silence detection - greeting still playing")
-                                    return
-
-                                # Skip if we're currently playing TTS
-                                if getattr(websocket, 'is_playing_tts', False):
-                                    logger.info("⏸️  Skipping silence detection - AI is speaking")
-                                    return
-
-                                if current_time - websocket.last_response_time > 5:  # Cooldown
-                                    logger.info("🔇 Silence detected, transcribing audio...")
-
-                                    # Play instant filler word first for immediate feedback
-                                    # (only if greeting is complete)
-                                    if websocket.greeting_complete:
-                                        try:
-                                            from caller_memory import get_filler_word
-                                            filler = get_filler_word()
-                                            websocket.is_playing_tts = True
-                                            try:
-                                                await stream_speech_to_twilio(filler, websocket, stream_sid)
-                                                logger.info(f"🗣️ Played instant filler: '{filler}'")
-                                            finally:
-                                                # ALWAYS reset flag, even if TTS fails
-                                                websocket.is_playing_tts = False
-                                        except Exception as e:
-                                            logger.error(f"Failed to play filler word: {e}")
-                                            # Flag already reset in finally block
+    except Exception as e:
+        # Traceback only formatted when debug logging is on
+        logger.error(f"ElevenLabs streaming error: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+
+async def _debug_on_media(websocket: WebSocket, data: dict):
+    """Buffer caller audio and schedule a reply once they go quiet"""
+    # Handle incoming audio from caller
+    stream_sid = data.get('streamSid', getattr(websocket, 'stream_sid', 'unknown'))
+    audio_payload = data['media']['payload']
+    audio_chunk = _b64decode(audio_payload)
+    
+    # Initialize counters and audio buffer if not present
+    if not hasattr(websocket, 'audio_chunk_count'):
+        websocket.audio_chunk_count = 0
+        websocket.last_audio_time = time.time()
+        websocket.last_response_time = time.time()  # Set to now so greeting doesn't trigger silence detection
+        websocket.silence_task = None
+        websocket.greeting_complete = False
+        websocket.audio_buffer = []  # Buffer for STT
+
+    # Per-frame state in locals; written back to the websocket only when it changes
+    audio_chunk_count = websocket.audio_chunk_count + 1
+    websocket.audio_chunk_count = audio_chunk_count
+    greeting_complete = websocket.greeting_complete
+
+    # Detect if audio chunk contains actual speech (amplitude-based)
+    # µ-law audio: silent chunks have values near 127 (neutral), speech has variation
+    # Imported here, not at module level: only the debug stream needs audioop, and
+    # on Python 3.13 it comes from audioop-lts, which shouldn't gate app startup
+    import audioop
+    rms = audioop.rms(audio_chunk, 1)  # Root mean square for µ-law (1 byte per sample)
+    # Threshold: Background noise is ~30-60 RMS, actual speech is 100+ RMS
+    is_speech = rms > 70  # Lowered for faster speech detection (was 80)
+
+    if is_speech:
+        websocket.last_audio_time = time.time()
+
+    # Buffer audio chunks for transcription
+    websocket.audio_buffer.append(audio_chunk)
+
+    # Mark greeting as complete after receiving substantial audio (user is speaking)
+    if not greeting_complete and audio_chunk_count > 100:
+        websocket.greeting_complete = greeting_complete = True
+        logger.info("👤 User started speaking, enabling silence detection")
+
+    if audio_chunk_count % 100 == 0:
+        # Log RMS values to calibrate threshold
+        logger.info("🔊 Audio RMS: %d, is_speech: %s", rms, is_speech)
+        # Log every 100 chunks so we know audio is coming in
+        logger.info("📥 Received %d audio chunks (%d bytes each)", audio_chunk_count, len(audio_chunk))
+
+    # Only use silence detection AFTER user has started speaking (greeting is done)
+    if greeting_complete:
+        # Simple silence detection: Respond after 3 seconds of silence
+        # Only create task if there isn't one already running
+        silence_task = getattr(websocket, 'silence_task', None)
+
+        # If speech detected, cancel any pending silence task
+        if is_speech and silence_task and not silence_task.done():
+            silence_task.cancel()
+            websocket.silence_task = None
+
+        # If no speech and no task running, create new silence detection task
+        if not is_speech and (silence_task is None or silence_task.done()):
+            # Create new silence detection task
+            async def check_silence():
+                await asyncio.sleep(1.5)  # Reduced for faster response (was 2.0s)
+                # Check if still silent
+                last_audio = getattr(websocket, 'last_audio_time', time.time())
+                time_since_speech = time.time() - last_audio
+                logger.info("⏱️ Checking silence: %.1fs since last speech", time_since_speech)
+                if time_since_speech >= 1.4:  # Reduced from 1.9s
+                    # User stopped talking, transcribe and respond
+                    current_time = time.time()
+
+                    # Skip if greeting hasn't completed yet
+                    if not getattr(websocket, 'greeting_complete', False):
+                        logger.info("⏸️  Skipping silence detection - greeting still playing")
+                        return
+
+                    # Skip if we're currently playing TTS
+                    if getattr(websocket, 'is_playing_tts', False):
+                        logger.info("⏸️  Skipping silence detection - AI is speaking")
+                        return
+
+                    if current_time - websocket.last_response_time > 5:  # Cooldown
+                        logger.info("🔇 Silence detected, transcribing audio...")
+
+                        # Play instant filler word first for immediate feedback
+                        # (only if greeting is complete)
+                        if websocket.greeting_complete:
+                            try:
+                                from caller_memory import get_filler_word
+                                filler = get_filler_word()
+                                websocket.is_playing_tts = True
+                                try:
+                                    await stream_speech_to_twilio(filler, websocket, stream_sid)
+                                    logger.info(f"🗣️ Played instant filler: '{filler}'")
+                                finally:
+                                    # ALWAYS reset flag, even if TTS fails
+                                    websocket.is_playing_tts = False
+                            except Exception as e:
+                                logger.error(f"Failed to play filler word: {e}")
+                                # Flag already reset in finally block
 
-                                    try:
-                                        # Get buffered audio and transcribe
-                                        audio_buffer = getattr(websocket, 'audio_buffer', [])
-                                        audio_data = b''.join(audio_buffer)
-                                        websocket.audio_buffer = []  # Clear buffer
+                        try:
+                            # Get buffered audio and transcribe
+                            audio_buffer = getattr(websocket, 'audio_buffer', [])
+                            audio_data = b''.join(audio_buffer)
+                            websocket.audio_buffer = []  # Clear buffer
 
-                                        if len(audio_data) > 1000:  # Need substantial audio
-                                            # Transcribe with Whisper
-                                            transcription = await transcribe_audio_buffer(audio_data)
+                            if len(audio_data) > 1000:  # Need substantial audio
+                                # Transcribe with Whisper
+                                transcription = await transcribe_audio_buffer(audio_data)
 
-                                            # Filter out junk transcriptions (silence, noise, very short filler)
-                                            # Only filter if transcription is ONLY these words (not part of a sentence)
-                                            junk_phrases = ['. .', '..', '.', ' ', 'huh', 'um', 'uh', 'hmm', 'mm', 'mhm']
-                                            transcription_clean = transcription.strip().lower()
+                                # Filter out junk transcriptions (silence, noise, very short filler)
+                                # Only filter if transcription is ONLY these words (not part of a sentence)
+                                junk_phrases = ['. .', '..', '.', ' ', 'huh', 'um', 'uh', 'hmm', 'mm', 'mhm']
+                                transcription_clean = transcription.strip().lower()
 
-                                            is_junk = (
-                                                not transcription or
-                                                transcription_clean in junk_phrases or
-                                                len(transcription_clean) < 2  # Changed from 3 to 2
-                                            )
+                                is_junk = (
+                                    not transcription or
+                                    transcription_clean in junk_phrases or
+                                    len(transcription_clean) < 2  # Changed from 3 to 2
+                                )
 
-                                            if transcription and not is_junk:
-                                                # Initialize conversation history if needed
-                                                if not hasattr(websocket, 'conversation_history'):
-                                                    from caller_memory import get_response_style_prompt
+                                if transcription and not is_junk:
+                                    # Initialize conversation history if needed
+                                    if not hasattr(websocket, 'conversation_history'):
+                                        from caller_memory import get_response_style_prompt
 
-                                                    # Get dynamic response style to prevent repetitive questions
-                                                    style_instruction = get_response_style_prompt()
+                                        # Get dynamic response style to prevent repetitive questions
+                                        style_instruction = get_response_style_prompt()
 
-                                                    base_prompt = """You are Synthetic Jason, an AI version of artist Jason Huff. This is an artist hotline where you talk to people about their art projects, creative ideas, internet culture, and creative technology.
+                                        base_prompt = """You are Synthetic Jason, an AI version of artist Jason Huff. This is an artist hotline where you talk to people about their art projects, creative ideas, internet culture, and creative technology.
 
 You're enthusiastic, thoughtful, and a bit unhinged in the best way. You love when people bring their projects and ideas to discuss. Help them think through concepts, brainstorm directions, and explore what's possible. You think about art as experimentation and play.
 
 Keep responses under 50 words so you can actually develop thoughts. Be conversational and real."""
-                                                    full_prompt = f"{base_prompt}\n\n{style_instruction}"
-
-                                                    websocket.conversation_history = [
-                                                        {"role": "system", "content": full_prompt}
-                                                    ]
-                                                    logger.info(f"🎨 Response style: {style_instruction[:50]}...")
-
-                                                # Add user message to history
-                                                websocket.conversation_history.append({"role": "user", "content": transcription})
-
-                                                # Keep only last 10 messages (5 exchanges) to save tokens
-                                                if len(websocket.conversation_history) > 11:  # system + 10 messages
-                                                    websocket.conversation_history = [websocket.conversation_history[0]] + websocket.conversation_history[-10:]
-
-                                                # Generate intelligent response with GPT-4o-mini (faster + cheaper)
-                                                from openai import OpenAI
-                                                client = OpenAI(api_key=config.OPENAI_API_KEY)
-
-                                                # Enable streaming for faster first token
-                                                stream = client.chat.completions.create(
-                                                    model="gpt-4o-mini",  # 10x faster and cheaper than gpt-4
-                                                    messages=websocket.conversation_history,
-                                                    max_tokens=60,  # Shorter for faster responses
-                                                    temperature=0.9,
-                                                    stream=True  # Stream for lower latency
-                                                )
-
-                                                # Collect response chunks
-                                                response_chunks = []
-                                                for chunk in stream:
-                                                    if chunk.choices[0].delta.content:
-                                                        response_chunks.append(chunk.choices[0].delta.content)
-
-                                                response_text = ''.join(response_chunks).strip()
-                                                logger.info(f"💬 GPT response: '{response_text}'")
-
-                                                # Add assistant response to history
-                                                websocket.conversation_history.append({"role": "assistant", "content": response_text})
-
-                                                # Stream response via ElevenLabs (protected from interference)
-                                                websocket.is_playing_tts = True
-                                                try:
-                                                    await stream_speech_to_twilio(response_text, websocket, stream_sid)
-                                                    logger.info(f"✅ Sent intelligent response")
-                                                finally:
-                                                    # ALWAYS reset flag, even if TTS fails
-                                                    websocket.is_playing_tts = False
-                                                    websocket.last_response_time = time.time()
-                                            else:
-                                                logger.info(f"🗑️ Filtered junk transcription: '{transcription}'")
-                                                # Update cooldown to prevent immediately detecting silence again
-                                                websocket.last_response_time = time.time()
-                                        else:
-                                            logger.debug(f"Audio buffer too small: {len(audio_data)} bytes")
-                                            # Update cooldown to prevent spam on small buffers
-                                            websocket.last_response_time = time.time()
-
-                                    except Exception as e:
-                                        logger.error(f"Failed to generate response: {e}")
-                                        import traceback
-                                        logger.debug(f"Traceback: {traceback.format_exc()}")
-                                        # Update cooldown even on error to prevent spam
+                                        full_prompt = f"{base_prompt}\n\n{style_instruction}"
+
+                                        websocket.conversation_history = [
+                                            {"role": "system", "content": full_prompt}
+                                        ]
+                                        logger.info(f"🎨 Response style: {style_instruction[:50]}...")
+
+                                    # Add user message to history
+                                    websocket.conversation_history.append({"role": "user", "content": transcription})
+
+                                    # Keep only last 10 messages (5 exchanges) to save tokens
+                                    if len(websocket.conversation_history) > 11:  # system + 10 messages
+                                        websocket.conversation_history = [websocket.conversation_history[0]] + websocket.conversation_history[-10:]
+
+                                    # Generate intelligent response with GPT-4o-mini (faster + cheaper),
+                                    # speaking each sentence as soon as it's written instead of
+                                    # waiting for the whole reply
+                                    spoken_sentences = []
+
+                                    async def reply_sentences():
+                                        async for sentence in openai_sentences(
+                                            websocket.conversation_history,
+                                            model="gpt-4o-mini",  # 10x faster and cheaper than gpt-4
+                                            max_tokens=60,  # Shorter for faster responses
+                                            stop=["\n\n"],  # One paragraph is all a phone reply needs
+                                            temperature=0.9
+                                        ):
+                                            spoken_sentences.append(sentence)
+                                            yield sentence
+
+                                    # Stream response via ElevenLabs (protected from interference)
+                                    websocket.is_playing_tts = True
+                                    try:
+                                        await stream_sentences_to_twilio(reply_sentences(), websocket, stream_sid)
+                                        logger.info(f"✅ Sent intelligent response")
+                                    finally:
+                                        # ALWAYS reset flag, even if TTS fails
+                                        websocket.is_playing_tts = False
                                         websocket.last_response_time = time.time()
 
-                        websocket.silence_task = asyncio.create_task(check_silence())
-            
-            elif event == 'closed':
-                logger.info("🔍 Debug: Media stream closed")
-
-                # Cancel any pending silence detection task
-                if hasattr(websocket, 'silence_task') and websocket.silence_task:
-                    if not websocket.silence_task.done():
-                        websocket.silence_task.cancel()
-                        logger.info("🛑 Cancelled pending silence detection task")
-
-                # Save caller memory when call ends
-                if hasattr(websocket, 'phone_number') and websocket.phone_number != 'unknown':
-                    try:
-                        from caller_memory import update_caller
-                        update_caller(websocket.phone_number)
-                        logger.info(f"📝 Saved call memory for {websocket.phone_number}")
-                    except Exception as e:
-                        logger.error(f"Failed to save caller memory: {e}")
+                                        response_text = ' '.join(spoken_sentences)
+                                        logger.info(f"💬 GPT response: '{response_text}'")
 
+                                        # Add assistant response to history
+                                        if response_text:
+                                            websocket.conversation_history.append({"role": "assistant", "content": response_text})
+                                else:
+                                    logger.info(f"🗑️ Filtered junk transcription: '{transcription}'")
+                                    # Update cooldown to prevent immediately detecting silence again
+                                    websocket.last_response_time = time.time()
+                            else:
+                                logger.debug(f"Audio buffer too small: {len(audio_data)} bytes")
+                                # Update cooldown to prevent spam on small buffers
+                                websocket.last_response_time = time.time()
+
+                        except Exception as e:
+                            # Traceback only formatted when debug logging is on
+                            logger.error(f"Failed to generate response: {e}", exc_info=logger.isEnabledFor(logging.DEBUG))
+                            # Update cooldown even on error to prevent spam
+                            websocket.last_response_time = time.time()
+
+            websocket.silence_task = asyncio.create_task(check_silence())
+
+async def _debug_on_closed(websocket: WebSocket, data: dict):
+    """Stop silence detection and save caller memory; ends the stream"""
+    logger.info("🔍 Debug: Media stream closed")
+
+    # Cancel any pending silence detection task
+    if hasattr(websocket, 'silence_task') and websocket.silence_task:
+        if not websocket.silence_task.done():
+            websocket.silence_task.cancel()
+            logger.info("🛑 Cancelled pending silence detection task")
+
+    # Save caller memory when call ends
+    if hasattr(websocket, 'phone_number') and websocket.phone_number != 'unknown':
+        try:
+            from caller_memory import update_caller
+            update_caller(websocket.phone_number)
+            logger.info(f"📝 Saved call memory for {websocket.phone_number}")
+        except Exception as e:
+            logger.error(f"Failed to save caller memory: {e}")
+
+    return True
+
+async def _debug_on_ping(websocket: WebSocket, data: dict):
+    await websocket.send_text(_dumps({
+        "event": "pong",
+        "timestamp": time.time()
+    }))
+
+# Event → handler for /test-websocket-debug. Handlers keep per-call state on the
+# websocket; a truthy return ends the stream.
+DEBUG_STREAM_HANDLERS = {
+    'media': _debug_on_media,
+    'start': _debug_on_start,
+    'connected': _debug_on_connected,
+    'closed': _debug_on_closed,
+    'ping': _debug_on_ping,
+    'test_sine_wave': _debug_on_test_sine_wave,
+    'test_coqui_audio': _debug_on_test_coqui_audio,
+}
+
+@app.websocket("/test-websocket-debug")
+async def test_websocket_debug(websocket: WebSocket):
+    """Debug WebSocket for Twilio Media Streams - Fixed for Railway"""
+    try:
+        await websocket.accept()
+        logger.info("WebSocket connected to Twilio Media Stream")
+        
+        # Don't send initial message - wait for Twilio events
+        # Twilio will send: connected, start, media, closed
+        
+        while True:
+            data = _loads(await receive_frame(websocket))
+            
+            event = data.get('event', 'unknown')
+            logger.debug("WebSocket event: %s", event)
+            
+            handler = DEBUG_STREAM_HANDLERS.get(event)
+            if handler is not None and await handler(websocket, data):
                 break
-                
-            elif event == 'ping':
-                await websocket.send_text(json.dumps({
-                    "event": "pong",
-                    "timestamp": time.time()
-                }))
             
     except WebSocketDisconnect:
         logger.info("🔍 Debug WebSocket disconnected")
@@ -2045,9 +3438,7 @@ async def realtime_websocket_stream(websocket: WebSocket):
     except WebSocketDisconnect:
         logger.info("Realtime API WebSocket disconnected")
     except Exception as e:
-        logger.error(f"Realtime API WebSocket error: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception(f"Realtime API WebSocket error: {e}")
 
 
 @app.post("/realtime-voice")
@@ -2058,21 +3449,14 @@ async def realtime_voice_handler(request: Request):
     This is activated when USE_REALTIME_API=true
     """
     try:
-        response = VoiceResponse()
-
         # Auto-detect Railway domain
         host = request.headers.get("host", "artist-hotline-production.up.railway.app")
-        ws_url = f"wss://{host}/realtime-stream"
 
-        logger.info(f"📞 Realtime API call - connecting to {ws_url}")
+        logger.info(f"📞 Realtime API call - connecting to wss://{host}/realtime-stream")
 
         # Connect to Realtime API WebSocket
-        connect = Connect()
-        stream = Stream(url=ws_url)
-        connect.append(stream)
-        response.append(connect)
-
-        return Response(content=str(response), media_type="application/xml")
+        twiml = REALTIME_STREAM_TWIML.format(host=html.escape(host))
+        return Response(content=twiml, media_type="application/xml")
 
     except Exception as e:
         logger.error(f"Realtime API voice handler error: {e}")
@@ -2081,6 +3465,22 @@ async def realtime_voice_handler(request: Request):
         return Response(content=str(response), media_type="application/xml")
 
 
+# Same <Gather> + goodbye for every debug turn; only the prompt in front of it varies
+_debug_response = VoiceResponse()
+_debug_response.gather(
+    input='speech',
+    action='/debug-voice-handler',
+    method='POST',
+    speech_timeout=3,
+    timeout=15,
+    enhanced=True
+)
+# Timeout fallback
+_debug_response.say("Thanks for testing the debug system! The audio quality should be crystal clear.")
+_debug_response.hangup()
+DEBUG_GATHER_TWIML = twiml_template(_debug_response)
+del _debug_response
+
 @app.api_route("/debug-voice-handler", methods=["GET", "POST"])
 async def debug_voice_handler(request: Request):
     """Debug TwiML handler - now using working WebSocket streaming!"""
@@ -2090,8 +3490,7 @@ async def debug_voice_handler(request: Request):
         from_number = form_data.get('From', 'unknown')
         call_sid = form_data.get('CallSid', 'unknown')
         
-        response = VoiceResponse()
-        
+        audio_url = None
         if not speech_result:
             # Initial call - no speech yet
             greeting_text = "Hello! This is the debug voice system. I can generate crystal clear audio. Please say something and I will respond."
@@ -2105,30 +3504,15 @@ async def debug_voice_handler(request: Request):
                     wav_data = await generate_simple_speech(greeting_text)
                     if wav_data:
                         # Save audio for serving
-                        import hashlib
-                        text_hash = hashlib.md5(greeting_text.encode()).hexdigest()
+                        text_hash = tts_cache_key(greeting_text)
                         audio_cache[text_hash] = wav_data
-                        audio_url = f"{config.BASE_URL}/audio/{text_hash}"
-                        response.play(audio_url)
+                        audio_url = AUDIO_URL_PREFIX + text_hash
                         logger.info("✅ Debug: Generated greeting with Simple TTS")
-                    else:
-                        response.say(greeting_text, voice="Polly.Joanna")
-                else:
-                    response.say(greeting_text, voice="Polly.Joanna")
                     
             except Exception as e:
                 logger.error(f"Debug TTS failed: {e}")
-                response.say(greeting_text, voice="Polly.Joanna")
             
-            # Listen for speech
-            gather = response.gather(
-                input='speech',
-                action='/debug-voice-handler',
-                method='POST',
-                speech_timeout=3,
-                timeout=15,
-                enhanced=True
-            )
+            prompt = play_or_say_twiml(audio_url, greeting_text, voice="Polly.Joanna")
             
         else:
             # User said something - respond!
@@ -2141,35 +3525,19 @@ async def debug_voice_handler(request: Request):
                 from simple_tts import generate_simple_speech
                 wav_data = await generate_simple_speech(response_text)
                 if wav_data:
-                    import hashlib
-                    text_hash = hashlib.md5(response_text.encode()).hexdigest()
+                    text_hash = tts_cache_key(response_text)
                     audio_cache[text_hash] = wav_data
-                    audio_url = f"{config.BASE_URL}/audio/{text_hash}"
-                    response.play(audio_url)
+                    audio_url = AUDIO_URL_PREFIX + text_hash
                     logger.info("✅ Debug: Generated response with Simple TTS")
-                else:
-                    response.say(response_text, voice="Polly.Joanna")
                     
             except Exception as e:
                 logger.error(f"Debug response TTS failed: {e}")
-                response.say(response_text, voice="Polly.Joanna")
             
-            # Continue listening
-            gather = response.gather(
-                input='speech',
-                action='/debug-voice-handler',
-                method='POST', 
-                speech_timeout=3,
-                timeout=15,
-                enhanced=True
-            )
-        
-        # Timeout fallback
-        response.say("Thanks for testing the debug system! The audio quality should be crystal clear.")
-        response.hangup()
+            prompt = play_or_say_twiml(audio_url, response_text, voice="Polly.Joanna")
         
+        # Prompt, then listen for speech (again)
         logger.info("📞 Debug voice handler - using traditional TwiML approach")
-        return Response(content=str(response), media_type="application/xml")
+        return Response(content=DEBUG_GATHER_TWIML.format(before=prompt, after=""), media_type="application/xml")
         
     except Exception as e:
         logger.error(f"Debug voice handler error: {e}")
@@ -2177,6 +3545,12 @@ async def debug_voice_handler(request: Request):
         response.say("Debug system error occurred")
         return Response(content=str(response), media_type="application/xml")
 
+# Only the caller's number (a <Parameter> value) changes per call
+_debug_ws_response = VoiceResponse()
+_debug_ws_response.connect().stream(url=DEBUG_STREAM_URL).parameter(name="phoneNumber", value="{phone_number}")
+DEBUG_WEBSOCKET_TWIML = str(_debug_ws_response)
+del _debug_ws_response
+
 @app.api_route("/debug-websocket-voice", methods=["GET", "POST"])
 async def debug_websocket_voice_handler(request: Request):
     """WebSocket-only debug voice handler - now that we know WebSockets work!"""
@@ -2185,20 +3559,12 @@ async def debug_websocket_voice_handler(request: Request):
         form_data = await request.form()
         from_number = form_data.get('From', 'unknown')
 
-        response = VoiceResponse()
-        # No Twilio TTS announcement - go straight to WebSocket streaming
-
-        # Connect to our WebSocket for streaming audio, pass phone number
-        connect = response.connect()
-        ws_url = config.BASE_URL.replace("https://", "wss://").replace("http://", "ws://")
-        debug_url = f"{ws_url}/test-websocket-debug"
-
-        # Pass phone number as custom parameter
-        stream = connect.stream(url=debug_url)
-        stream.parameter(name="phoneNumber", value=from_number)
+        # No Twilio TTS announcement - go straight to WebSocket streaming,
+        # passing the phone number as a custom stream parameter
+        twiml = DEBUG_WEBSOCKET_TWIML.format(phone_number=html.escape(from_number))
 
         logger.info(f"📞 WebSocket voice handler - caller: {from_number}")
-        return Response(content=str(response), media_type="application/xml")
+        return Response(content=twiml, media_type="application/xml")
         
     except Exception as e:
         logger.error(f"WebSocket debug voice handler error: {e}")
@@ -2264,16 +3630,15 @@ async def static_killer_stream(websocket: WebSocket):
     call_sid = None
     
     try:
-        from static_killer import convert_wav_static_free, chunk_for_streaming, create_media_payload
+        from static_killer import convert_wav_static_free, chunk_for_streaming
         from simple_tts import generate_simple_speech
         
         await websocket.accept()
         logger.info("🔪 Static Killer WebSocket accepted")
         
         while True:
-            message = await websocket.receive_text()
-            data = json.loads(message)
-            logger.debug(f"Static Killer received: {data['event']}")
+            data = _loads(await receive_frame(websocket))
+            logger.debug("Static Killer received: %s", data['event'])
             
             if data['event'] == 'connected':
                 logger.info("✅ Static Killer Media stream connected")
@@ -2302,13 +3667,11 @@ async def static_killer_stream(websocket: WebSocket):
                     # Chunk for optimal streaming
                     chunks = chunk_for_streaming(raw_mulaw)
                     
-                    # Stream each chunk with proper timing
-                    for i, chunk in enumerate(chunks):
-                        payload = create_media_payload(chunk, stream_sid)
-                        await websocket.send_text(json.dumps(payload))
-                        
-                        # Delay for proper streaming (160ms per chunk)
-                        await asyncio.sleep(0.16)
+                    # Serialize every frame up front (payload spliced into the fixed envelope,
+                    # no dict/JSON encode per chunk), then stream with proper timing (160ms per chunk)
+                    prefix, suffix = media_frame_template(stream_sid)
+                    messages = [prefix + base64.b64encode(chunk).decode('ascii') + suffix for chunk in chunks]
+                    await send_paced(websocket, messages, 0.16)
                     
                     logger.info(f"✅ Static Killer: Streamed {len(chunks)} chunks ({len(raw_mulaw)} total bytes)")
                     
@@ -2329,9 +3692,7 @@ async def static_killer_stream(websocket: WebSocket):
         logger.error("❌ Static Killer dependencies not available")
         await websocket.close()
     except Exception as e:
-        logger.error(f"Static Killer stream error: {e}")
-        import traceback
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.exception(f"Static Killer stream error: {e}")
 
 @app.post("/test-audio-play") 
 async def test_audio_play_endpoint():
@@ -2375,19 +3736,9 @@ async def static_killer_voice_handler(request: Request):
     Use this as your Twilio webhook URL to test the static-free system.
     """
     try:
-        response = VoiceResponse()
-        
-        # Add a simple greeting and connect to Static Killer stream
-        response.say("Connecting to Static Killer test system...")
-        
-        # Connect to Static Killer WebSocket
-        connect = response.connect()
-        ws_url = config.BASE_URL.replace("https://", "wss://").replace("http://", "ws://")
-        stream_url = f"{ws_url}/static-killer-stream"
-        connect.stream(url=stream_url)
-        
+        # Greeting + connect to the Static Killer stream; the document never changes
         logger.info("📞 Static Killer call initiated")
-        return Response(content=str(response), media_type="application/xml")
+        return Response(content=STATIC_KILLER_TWIML, media_type="application/xml")
         
     except Exception as e:
         logger.error(f"Static Killer voice handler error: {e}")
@@ -2397,4 +3748,7 @@ async def static_killer_voice_handler(request: Request):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)))
\ No newline at end of file
+    # uvloop + httptools (both from uvicorn[standard]) instead of asyncio's loop and h11.
+    # One worker on purpose: calls span several requests (the /play-response redirect,
+    # /audio relays, media-stream state) that must land on the process holding them.
+    uvicorn.run(app, host="0.0.0.0", port=int(os.getenv("PORT", 8000)), loop="uvloop", http="httptools")
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Persistent storage for completed call transcripts.
+
+Finished calls are moved out of the in-memory `call_transcripts` dict in
+main.py and written here in batches by a background worker, so memory no
+longer grows with every call the hotline has ever taken.
+
+Uses SQLite from the standard library. Functions are synchronous - call
+them via asyncio.to_thread() from async code.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Dict, List, Optional
+
+TRANSCRIPTS_DB = os.getenv("TRANSCRIPTS_DB", "transcripts.db")
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a short-lived connection (sqlite3 connections can't be shared across threads)"""
+    return sqlite3.connect(TRANSCRIPTS_DB)
+
+
+def init_db():
+    """Create the transcripts table if it doesn't exist"""
+    with _connect() as conn:
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS transcripts (
+                call_sid TEXT PRIMARY KEY,
+                from_number TEXT,
+                start_time TEXT,
+                conversation TEXT
+            )"""
+        )
+
+
+def _merge_transcripts(saved: Dict, t: Dict) -> Dict:
+    """
+    Combine two copies of one call's transcript.
+
+    The same call can be written more than once: rewritten whole after a late
+    turn, or in pieces when it was evicted from memory and then reopened with a
+    fresh conversation. Turns are matched by (timestamp, caller), so rewriting
+    a copy adds nothing and a piece adds only the turns that are new.
+    """
+    conversation = list(saved.get('conversation', []))
+    seen = {(turn.get('timestamp'), turn.get('caller')) for turn in conversation}
+    for turn in t.get('conversation', []):
+        if (turn.get('timestamp'), turn.get('caller')) not in seen:
+            conversation.append(turn)
+    conversation.sort(key=lambda turn: turn.get('timestamp') or '')
+    start_times = [ts for ts in (saved.get('start_time'), t.get('start_time')) if ts]
+    return {
+        'from_number': saved.get('from_number') or t.get('from_number'),
+        'start_time': min(start_times) if start_times else None,
+        'conversation': conversation
+    }
+
+
+def save_transcripts(batch: List[tuple]):
+    """Write a batch of (call_sid, transcript) pairs in a single transaction, merging into saved rows"""
+    merged: Dict[str, Dict] = {}
+    for call_sid, t in batch:
+        merged[call_sid] = _merge_transcripts(merged[call_sid], t) if call_sid in merged else t
+    with _connect() as conn:
+        rows = []
+        for call_sid, t in merged.items():
+            row = conn.execute(
+                "SELECT call_sid, from_number, start_time, conversation FROM transcripts WHERE call_sid = ?",
+                (call_sid,)
+            ).fetchone()
+            if row:
+                t = _merge_transcripts(_row_to_transcript(row), t)
+            rows.append((call_sid, t.get('from_number'), t.get('start_time'), json.dumps(t.get('conversation', []))))
+        conn.executemany(
+            "INSERT OR REPLACE INTO transcripts (call_sid, from_number, start_time, conversation) VALUES (?, ?, ?, ?)",
+            rows
+        )
+
+
+def _row_to_transcript(row: tuple) -> Dict:
+    return {
+        'from_number': row[1],
+        'start_time': row[2],
+        'conversation': json.loads(row[3])
+    }
+
+
+def count_transcripts() -> int:
+    """Number of persisted transcripts"""
+    with _connect() as conn:
+        return conn.execute("SELECT COUNT(*) FROM transcripts").fetchone()[0]
+
+
+def list_transcripts(limit: int = 50, offset: int = 0) -> Dict[str, Dict]:
+    """Page of persisted transcripts keyed by call SID, newest first"""
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT call_sid, from_number, start_time, conversation FROM transcripts "
+            "ORDER BY start_time DESC LIMIT ? OFFSET ?",
+            (limit, offset)
+        ).fetchall()
+    return {row[0]: _row_to_transcript(row) for row in rows}
+
+
+def get_transcript(call_sid: str) -> Optional[Dict]:
+    """Load a single persisted transcript"""
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT call_sid, from_number, start_time, conversation FROM transcripts WHERE call_sid = ?",
+            (call_sid,)
+        ).fetchone()
+    return _row_to_transcript(row) if row else None